@@ -1,13 +1,7 @@
 __version__ = '1.35.1'
 
-from .managers import Config
-from .items import Item
-from .exceptions import ConfigError, RequiredValueMissing, NotFound
-from .base import ItemAttribute
-from .persistence import ConfigPersistenceAdapter
-from .item_types import Types
-from .sections import Section
-from .plain import PlainConfig
+import importlib
+import sys
 
 
 all = [
@@ -22,3 +16,38 @@ all = [
     'RequiredValueMissing',
     'NotFound',
 ]
+
+
+# Public names are resolved on first access so that importing the package
+# does not pull in every subsystem (persistence adapters in particular).
+_lazy_imports = {
+    'Config': '.managers',
+    'Item': '.items',
+    'ConfigError': '.exceptions',
+    'RequiredValueMissing': '.exceptions',
+    'NotFound': '.exceptions',
+    'ItemAttribute': '.base',
+    'ConfigPersistenceAdapter': '.persistence',
+    'Types': '.item_types',
+    'Section': '.sections',
+    'PlainConfig': '.plain',
+}
+
+
+def __getattr__(name):
+    if name not in _lazy_imports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
+
+if sys.version_info < (3, 7):
+    # Module-level __getattr__ (PEP 562) is not supported, import everything eagerly.
+    for _name in _lazy_imports:
+        __getattr__(_name)
+    del _name
@@ -1,7 +1,11 @@
+import sys
+
 from .utils import not_set
 
 
 class BaseItem(object):
+    __slots__ = ()
+
     is_item = True
     is_section = False
     is_config = False
@@ -17,6 +21,8 @@ class BaseSection(object):
     No other functionality to be added here.
     """
 
+    __slots__ = ()
+
     is_item = False
     is_section = True
     is_config = False
@@ -31,11 +37,22 @@ class ItemAttribute(object):
     Class used in :class:`.Item` class to declare attributes of config items.
     """
 
+    __slots__ = ('name', 'default', 'value', 'attr_name', 'allow_dynamic_override')
+
+    def __new__(cls, name, default=not_set, value=not_set, allow_dynamic_override=False):
+        # Attributes that can't be overridden dynamically (the majority) get a specialised
+        # class with a cheaper __get__. Subclasses are left alone.
+        if cls is ItemAttribute and not allow_dynamic_override:
+            cls = _StaticItemAttribute
+        return super(ItemAttribute, cls).__new__(cls)
+
     def __init__(self, name, default=not_set, value=not_set, allow_dynamic_override=False):
         self.name = name
         self.default = default
         self.value = value
-        self.attr_name = '_{}'.format(self.name)
+        # Interned so that it is the same object as the attribute names used in code
+        # (``self._raw_str_value``) and instance dictionary lookups can match keys by identity.
+        self.attr_name = sys.intern('_' + name)
 
         # If set to True, this becomes an expensive attribute because now when
         # its value is requested we will check for a registered
@@ -50,10 +67,34 @@ class ItemAttribute(object):
         setattr(instance, self.attr_name, value)
 
     def __get__(self, instance, owner):
+        if instance is None:
+            return self.default
         if self.allow_dynamic_override:
-            if instance.section:
-                try:
-                    return instance.section.get_item_attribute(instance, self.name)
-                except AttributeError:
-                    pass
-        return getattr(instance, self.attr_name, self.default)
+            section = instance.section
+            if section is not None:
+                # Look the provider up first rather than have get_item_attribute raise
+                # an AttributeError every time no provider is registered (the common case).
+                provider = section._get_item_attribute_provider(self.name)
+                if provider is not None:
+                    try:
+                        return provider(instance)
+                    except AttributeError:
+                        pass
+        # A single dictionary probe -- getattr() with a default would go through
+        # Item.__getattr__ and raise and swallow an AttributeError for every unset attribute.
+        return instance.__dict__.get(self.attr_name, self.default)
+
+
+class _StaticItemAttribute(ItemAttribute):
+    """
+    :class:`.ItemAttribute` with ``allow_dynamic_override=False``.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance, owner):
+        try:
+            return instance.__dict__.get(self.attr_name, self.default)
+        except AttributeError:
+            # Accessed on the class
+            return self.default
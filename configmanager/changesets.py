@@ -6,11 +6,35 @@ _Change = collections.namedtuple('Change', field_names=(
 ))
 
 
+class _ItemChanges(object):
+    """
+    Net changes of one item in a changeset context: values before the first change,
+    values after the most recent one, and the number of changes.
+    Only these are ever reported so the individual changes aren't kept.
+    """
+
+    __slots__ = ('old_value', 'new_value', 'old_raw_str_value', 'new_raw_str_value', 'count')
+
+    def __init__(self, old_value, new_value, old_raw_str_value, new_raw_str_value):
+        self.old_value = old_value
+        self.new_value = new_value
+        self.old_raw_str_value = old_raw_str_value
+        self.new_raw_str_value = new_raw_str_value
+        self.count = 1
+
+
 class _ChangesetContext(object):
+    __slots__ = ('config', 'hook', '_changes', '_pending_changes', '_auto_reset')
+
+    #: Number of changes buffered before they are folded into net changes per item,
+    #: so that contexts which are never inspected don't keep every change around.
+    max_pending_changes = 64
+
     def __init__(self, config, auto_reset=False, **unsupported_options):
         self.config = config
         self.hook = None
-        self._changes = collections.defaultdict(list)
+        self._changes = {}
+        self._pending_changes = []
         self._auto_reset = auto_reset
 
     def __enter__(self):
@@ -22,8 +46,31 @@ class _ChangesetContext(object):
             self.reset()
 
     def _value_changed(self, item, old_value, new_value, old_raw_str_value, new_raw_str_value):
+        # Changes are only appended here, in the middle of setting the value,
+        # and folded into net changes per item in batches or when they are asked for.
         if old_value != new_value or old_raw_str_value != new_raw_str_value:
-            self._changes[item].append(_Change(old_value, new_value, old_raw_str_value, new_raw_str_value))
+            pending_changes = self._pending_changes
+            pending_changes.append((item, old_value, new_value, old_raw_str_value, new_raw_str_value))
+            if len(pending_changes) >= self.max_pending_changes:
+                self._get_changes()
+
+    def _get_changes(self):
+        """
+        Returns the net changes per item with any pending changes folded in.
+        """
+        changes = self._changes
+        pending_changes = self._pending_changes
+        if pending_changes:
+            for item, old_value, new_value, old_raw_str_value, new_raw_str_value in pending_changes:
+                item_changes = changes.get(item)
+                if item_changes is None:
+                    changes[item] = _ItemChanges(old_value, new_value, old_raw_str_value, new_raw_str_value)
+                else:
+                    item_changes.new_value = new_value
+                    item_changes.new_raw_str_value = new_raw_str_value
+                    item_changes.count += 1
+            pending_changes.clear()
+        return changes
 
     def push(self):
         assert self.hook is None
@@ -44,11 +91,9 @@ class _ChangesetContext(object):
         has changed in the context.
         """
         report = {}
-        for k, k_changes in self._changes.items():
-            if len(k_changes) == 1:
-                report[k] = k_changes[0].new_value
-            elif k_changes[0].old_value != k_changes[-1].new_value:
-                report[k] = k_changes[-1].new_value
+        for k, k_changes in self._get_changes().items():
+            if k_changes.count == 1 or k_changes.old_value != k_changes.new_value:
+                report[k] = k_changes.new_value
         return report
 
     @property
@@ -58,31 +103,34 @@ class _ChangesetContext(object):
         and the new. The mapping includes only items whose value or raw string value has changed in the context.
         """
         report = {}
-        for k, k_changes in self._changes.items():
-            if len(k_changes) == 1:
-                report[k] = k_changes[0]
-            else:
-                first = k_changes[0]
-                last = k_changes[-1]
-                if first.old_value != last.new_value or first.old_raw_str_value != last.new_raw_str_value:
-                    report[k] = _Change(
-                        first.old_value,
-                        last.new_value,
-                        first.old_raw_str_value,
-                        last.new_raw_str_value,
-                    )
+        for k, k_changes in self._get_changes().items():
+            if (
+                k_changes.count == 1
+                or k_changes.old_value != k_changes.new_value
+                or k_changes.old_raw_str_value != k_changes.new_raw_str_value
+            ):
+                report[k] = _Change(
+                    k_changes.old_value,
+                    k_changes.new_value,
+                    k_changes.old_raw_str_value,
+                    k_changes.new_raw_str_value,
+                )
         return report
 
     def reset(self, item=None):
-        for k, k_changes in self._changes.items():
-            if item is None or k is item:
-                k._value = k_changes[0].old_value
-                k.raw_str_value = k_changes[0].old_raw_str_value
-
+        changes = self._get_changes()
         if item is None:
-            self._changes.clear()
+            for k, k_changes in changes.items():
+                self._restore(k, k_changes)
+            changes.clear()
         else:
-            del self._changes[item]
+            # Changes are keyed by item, no need to look through the changes of all the others.
+            self._restore(item, changes.pop(item))
+
+    @staticmethod
+    def _restore(item, item_changes):
+        item._value = item_changes.old_value
+        item.raw_str_value = item_changes.old_raw_str_value
 
     def __len__(self):
         """
@@ -4,6 +4,18 @@ options and arguments (in click lingo) that fall back to
 *configmanager*.
 """
 
+from .items import _has_plain_value_access
+
+
+def _get_fallback_value(config_item):
+    if _has_plain_value_access(config_item.__class__):
+        # Same as checking has_value before reading value,
+        # but with the environment variable consulted only once.
+        return config_item.get(None)
+    if config_item.has_value:
+        return config_item.value
+    return None
+
 
 def _config_parameter(args, kwargs):
     config_item = args[-1]
@@ -11,17 +23,25 @@ def _config_parameter(args, kwargs):
 
     original_callback = kwargs.pop('callback', None)
 
-    def callback(ctx, param, value):
-        if value is None and config_item.has_value:
-            value = config_item.value
-        if original_callback:
+    # Whether there is an original callback to call is known now,
+    # so the callback doesn't have to check it every time it's called.
+    if original_callback:
+        def callback(ctx, param, value):
+            if value is None:
+                value = _get_fallback_value(config_item)
             original_callback(ctx, param, value)
-        return value
+            return value
+    else:
+        def callback(ctx, param, value):
+            if value is None:
+                value = _get_fallback_value(config_item)
+            return value
 
     kwargs['callback'] = callback
 
-    if config_item.type.builtin_types:
-        kwargs.setdefault('type', config_item.type.builtin_types[0])
+    builtin_types = config_item.type.builtin_types
+    if builtin_types:
+        kwargs.setdefault('type', builtin_types[0])
 
     return args[:-1], kwargs
 
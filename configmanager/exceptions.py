@@ -25,7 +25,8 @@ class NotFound(ConfigError):
         self.section = section
 
     def __repr__(self):
-        return '<{} {!r} in {}>'.format(self.__class__.__name__, self.name, self.section.alias if self.section else None)
+        section_alias = self.section.alias if self.section else None
+        return f'<{self.__class__.__name__} {self.name!r} in {section_alias}>'
 
 
 class RequiredValueMissing(ConfigError):
@@ -47,5 +48,5 @@ class RequiredValueMissing(ConfigError):
         self.item = item
 
     def __repr__(self):
-        return '<{} {!r} in {}>'.format(self.__class__.__name__, self.name, self.item)
+        return f'<{self.__class__.__name__} {self.name!r} in {self.item}>'
 
@@ -1,10 +1,14 @@
-import six
-
-from builtins import str as text
+import functools
 
 from .utils import not_set
 
 
+@functools.lru_cache(maxsize=1024)
+def _convert_str(builtin_type, payload):
+    # Config files tend to repeat the same few strings (0, 1, 5, 10 ...) many times.
+    return builtin_type(payload)
+
+
 class _ItemType(object):
     aliases = ()
     builtin_types = ()
@@ -15,8 +19,9 @@ class _ItemType(object):
     def deserialize(self, payload, **kwargs):
         if payload is None or payload is not_set:
             return payload
-        if self.builtin_types:
-            return self.builtin_types[0](payload)
+        builtin_types = self.builtin_types
+        if builtin_types:
+            return builtin_types[0](payload)
         else:
             return payload
 
@@ -37,68 +42,86 @@ class _ItemType(object):
 
     def set_item_value(self, item, raw_value):
         value = self.deserialize(raw_value)
-        if isinstance(raw_value, six.string_types):
+        if isinstance(raw_value, str):
             item._raw_str_value = raw_value
         else:
             item._raw_str_value = not_set
         item._value = value
 
     def __repr__(self):
-        return '<{} {}>'.format(self.__class__.__name__, self.aliases)
+        return f'<{self.__class__.__name__} {self.aliases}>'
 
     def __eq__(self, other):
         return isinstance(other, self.__class__)
 
 
+class _ImmutableBuiltinType(_ItemType):
+    """
+    Type whose values are instances of an immutable built-in type.
+    Values that already are of exactly that type need no conversion.
+    """
+
+    def deserialize(self, payload, **kwargs):
+        payload_type = type(payload)
+        builtin_type = self.builtin_types[0]
+        if payload_type is builtin_type:
+            return payload
+        if payload_type is str:
+            return _convert_str(builtin_type, payload)
+        return super(_ImmutableBuiltinType, self).deserialize(payload, **kwargs)
+
+
 class _NotSetType(_ItemType):
     def includes(self, obj):
         return obj is None or obj is not_set
 
 
-class _StrType(_ItemType):
+class _StrType(_ImmutableBuiltinType):
     aliases = ('str', 'string', 'unicode')
-    builtin_types = text,
+    builtin_types = str,
 
     def includes(self, obj):
-        return isinstance(obj, six.string_types)
+        return isinstance(obj, str)
 
 
-class _IntType(_ItemType):
+class _IntType(_ImmutableBuiltinType):
     aliases = ('int', 'integer')
     builtin_types = int,
 
     def accepts(self, obj):
-        return self.includes(obj) or isinstance(obj, six.string_types)
+        return self.includes(obj) or isinstance(obj, str)
 
 
 class _BoolType(_ItemType):
     aliases = ('bool', 'boolean')
     builtin_types = bool,
 
-    truthy_values = ('yes', 'true', 'y', 't', 'on', '1')
-    falsey_values = ('no', 'false', 'n', 'f', 'off', '0')
+    truthy_values = frozenset(('yes', 'true', 'y', 't', 'on', '1'))
+    falsey_values = frozenset(('no', 'false', 'n', 'f', 'off', '0'))
+    bool_values = truthy_values | falsey_values
 
     def accepts(self, obj):
-        if isinstance(obj, bool):
+        if obj is True or obj is False:
             return True
 
-        if isinstance(obj, six.string_types):
-            str = obj.lower()
-            return str in self.truthy_values or str in self.falsey_values
-
-        if isinstance(obj, six.integer_types) and obj == 1 or obj == 0:
-            return True
+        if isinstance(obj, str):
+            return obj in self.bool_values or obj.lower() in self.bool_values
 
-        return False
+        return obj in (0, 1)
 
     def deserialize(self, payload, **kwargs):
-        if isinstance(payload, bool):
+        if payload is True or payload is False:
             return payload
 
-        elif isinstance(payload, six.string_types):
+        elif isinstance(payload, str):
+            # Values are usually lowercase already, so try without lower() first.
+            if payload in self.truthy_values:
+                return True
+            if payload in self.falsey_values:
+                return False
             return payload.lower() in self.truthy_values
 
-        elif isinstance(payload, six.integer_types):
+        elif isinstance(payload, int):
             if payload == 1:
                 return True
             elif payload == 0:
@@ -107,7 +130,7 @@ class _BoolType(_ItemType):
         raise ValueError(payload)
 
 
-class _FloatType(_ItemType):
+class _FloatType(_ImmutableBuiltinType):
     aliases = ('float', 'double')
     builtin_types = float,
 
@@ -181,7 +204,12 @@ class _Types(object):
             <_StrType ('str', 'string', 'unicode')>
 
         """
-        if isinstance(type_, six.string_types):
+        if isinstance(type_, _ItemType):
+            # Already translated. Checked first because otherwise it would be compared
+            # to every built-in type below, each time through _ItemType.__eq__.
+            return type_
+
+        if isinstance(type_, str):
             for t in self.all_types:
                 if type_ in t.aliases:
                     return t
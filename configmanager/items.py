@@ -1,13 +1,43 @@
-from builtins import str
-import copy
 import os
 
-import six
-
 from .base import ItemAttribute, BaseItem
 from .exceptions import RequiredValueMissing
 from .item_types import Types
-from .utils import not_set
+from .utils import not_set, _deepcopy
+
+
+#: Per item class mapping of names of declared ItemAttributes to the names of
+#: instance attributes in which their values are stored.
+_item_attribute_storage = {}
+
+
+def _get_item_attribute_storage(cls):
+    storage = _item_attribute_storage.get(cls)
+    if storage is None:
+        storage = {}
+        for klass in reversed(cls.__mro__):
+            for k, v in vars(klass).items():
+                if isinstance(v, ItemAttribute) and type(v).__set__ is ItemAttribute.__set__:
+                    storage[k] = v.attr_name
+                else:
+                    storage.pop(k, None)
+        _item_attribute_storage[cls] = storage
+    return storage
+
+
+#: Per item class flag telling whether the class reads values the way Item does,
+#: i.e. doesn't override any of the methods and properties users extend items through.
+_plain_value_access = {}
+
+
+def _has_plain_value_access(cls):
+    plain = _plain_value_access.get(cls)
+    if plain is None:
+        plain = _plain_value_access[cls] = all(
+            getattr(cls, name) is getattr(Item, name)
+            for name in ('get', 'value', 'default', 'has_value', 'is_default')
+        )
+    return plain
 
 
 class Item(BaseItem):
@@ -63,7 +93,7 @@ class Item(BaseItem):
         Helper to get value of a named attribute irrespective of whether it is passed
         with or without "@" prefix.
         """
-        at_name = '@{}'.format(name)
+        at_name = '@' + name
 
         if name in kwargs:
             if at_name in kwargs:
@@ -81,12 +111,18 @@ class Item(BaseItem):
         """
 
         self._section = None
+        self._value = not_set
+        self._default = not_set
 
         if name is not not_set:
-            if not isinstance(name, six.string_types):
+            if not isinstance(name, str):
                 raise TypeError('Item name must be a string, got {!r}'.format(type(name)))
             self.name = name
 
+        if not kwargs:
+            # Nothing else to set, everything else is left at its class default.
+            return
+
         # Type must be set first because otherwise setting value below may fail.
         type_ = self._get_kwarg('type', kwargs)
         if type_ is not not_set:
@@ -104,50 +140,55 @@ class Item(BaseItem):
             elif default is not not_set and default is not None:
                 self.type = Types.guess(default)
 
-        self._value = not_set
-        self._default = not_set
-
         #
         # Set all attributes except type which has already been set.
         # Unknown extra attributes are OK.
         #
+        # Values of declared item attributes are stored directly, bypassing
+        # attribute lookup and ItemAttribute.__set__.
+        storage = _get_item_attribute_storage(self.__class__)
+        instance_dict = self.__dict__
+
         for k, v in kwargs.items():
-            if k in ('type', '@type'):
-                continue
+            # A single look at the first character covers all the checks (and is safe for empty names).
+            prefix = k[:1]
 
-            if k.startswith('_'):
+            if prefix == '_':
                 raise ValueError('Item attribute names should start with a letter, got {!r}'.format(k))
 
             # Allow user to pass meta information with @ prefixes
-            if k.startswith('@'):
-                setattr(self, k[1:], v)
+            if prefix == '@':
+                k = k[1:]
+
+            if k == 'type':
+                continue
+
+            if k in storage:
+                instance_dict[storage[k]] = v
             else:
                 setattr(self, k, v)
 
     def __getattr__(self, name):
         if name.startswith('_'):
             raise AttributeError()
-        if self.section:
-            return self.section.get_item_attribute(self, name)
+        section = self._section
+        if section is not None:
+            return section.get_item_attribute(self, name)
         raise AttributeError(name)
 
     def __repr__(self):
-        if self._value is not not_set:
-            value = self.value
-        elif self.default is not not_set:
-            value = self.default
-        else:
-            value = self.default
-
-        return '<{} {} {!r}>'.format(self.__class__.__name__, self.name, value)
+        # Without a custom value, the default (or not_set) is shown as it is, without copying it.
+        value = self.value if self._value is not not_set else self.default
+        return f'<{self.__class__.__name__} {self.name} {value!r}>'
 
     def __str__(self):
         return repr(self)
 
     @property
     def str_value(self):
-        if self.raw_str_value is not not_set:
-            return self.raw_str_value
+        raw_str_value = self.__dict__.get('_raw_str_value', not_set)
+        if raw_str_value is not not_set:
+            return raw_str_value
         if self._value is not not_set or self.default is not not_set:
             return str(self.value)
         else:
@@ -182,19 +223,27 @@ class Item(BaseItem):
 
         Returns not_set otherwise.
         """
-        envvar_name = None
+        envvar = self.envvar
+
+        if not envvar:
+            # The common case -- item is not controlled by an environment variable.
+            return not_set
 
-        if self.envvar is True:
+        if envvar is True:
             envvar_name = self.envvar_name
             if envvar_name is None:
+                # get_path() builds on the section's cached path.
                 envvar_name = '_'.join(self.get_path()).upper()
-        elif self.envvar:
-            envvar_name = self.envvar
-
-        if envvar_name and envvar_name in os.environ:
-            return self.type.deserialize(os.environ[envvar_name])
         else:
-            return not_set
+            envvar_name = envvar
+
+        if envvar_name:
+            # os.environ is a Python-level mapping, so look the name up only once.
+            envvar_value = os.environ.get(envvar_name)
+            if envvar_value is not None:
+                return self.type.deserialize(envvar_value)
+
+        return not_set
 
     def get(self, fallback=not_set):
         """
@@ -204,16 +253,23 @@ class Item(BaseItem):
             :meth:`.set` and :attr:`.value`
         """
 
-        envvar_value = self._get_envvar_value()
-        if envvar_value is not not_set:
-            return envvar_value
+        # Items not controlled by an environment variable (the common case)
+        # take a single branch here instead of a call to _get_envvar_value.
+        if self.envvar:
+            envvar_value = self._get_envvar_value()
+            if envvar_value is not not_set:
+                return envvar_value
 
-        if self.has_value:
-            if self._value is not not_set:
-                return self._value
-            else:
-                return copy.deepcopy(self.default)
-        elif fallback is not not_set:
+        # Equivalent of has_value check without consulting the environment variable again.
+        value = self._value
+        if value is not not_set:
+            return value
+
+        default = self.default
+        if default is not not_set:
+            return _deepcopy(default)
+
+        if fallback is not not_set:
             return fallback
         elif self.required:
             raise RequiredValueMissing(name=self.name, item=self)
@@ -232,8 +288,10 @@ class Item(BaseItem):
         """
         Sets config value.
         """
+        # raw_str_value is a plain stored attribute, read it without going through the descriptor.
+        instance_dict = self.__dict__
         old_value = self._value
-        old_raw_str_value = self.raw_str_value
+        old_raw_str_value = instance_dict.get('_raw_str_value', not_set)
 
         self.type.set_item_value(self, value)
 
@@ -243,14 +301,15 @@ class Item(BaseItem):
             # Nothing to report
             return
 
-        if self.section:
-            self.section.dispatch_event(
-                self.section.hooks.item_value_changed,
+        section = self._section
+        if section is not None:
+            section.dispatch_event(
+                section.hooks.item_value_changed,
                 item=self,
                 old_value=old_value,
                 new_value=new_value,
                 old_raw_str_value=old_raw_str_value,
-                new_raw_str_value=self.raw_str_value
+                new_raw_str_value=instance_dict.get('_raw_str_value', not_set),
             )
 
     def reset(self):
@@ -258,25 +317,26 @@ class Item(BaseItem):
         Resets the value of config item to its default value.
         """
         old_value = self._value
-        old_raw_str_value = self.raw_str_value
+        old_raw_str_value = self.__dict__.get('_raw_str_value', not_set)
 
         self._value = not_set
-        self.raw_str_value = not_set
+        self._raw_str_value = not_set
 
-        new_value = self._value
+        new_value = not_set
 
         if old_value is not_set:
             # Nothing to report
             return
 
-        if self.section:
-            self.section.dispatch_event(
-                self.section.hooks.item_value_changed,
+        section = self._section
+        if section is not None:
+            section.dispatch_event(
+                section.hooks.item_value_changed,
                 item=self,
                 old_value=old_value,
                 new_value=new_value,
                 old_raw_str_value=old_raw_str_value,
-                new_raw_str_value=self.raw_str_value,
+                new_raw_str_value=not_set,
             )
 
     @property
@@ -288,21 +348,53 @@ class Item(BaseItem):
         if the environment variable is set and is different to the
         default value of the item.
         """
-        envvar_value = self._get_envvar_value()
-        if envvar_value is not not_set:
-            return envvar_value == self.default
-        else:
-            return self._value is not_set or self._value == self.default
+        if self.envvar:
+            envvar_value = self._get_envvar_value()
+            if envvar_value is not not_set:
+                return envvar_value == self.default
+
+        value = self._value
+        return value is not_set or value == self.default
 
     @property
     def has_value(self):
         """
         ``True`` if item has a default value or custom value set.
         """
-        if self._get_envvar_value() is not not_set:
+        if self.default is not not_set or self._value is not not_set:
             return True
-        else:
-            return self.default is not not_set or self._value is not not_set
+        if self.envvar:
+            return self._get_envvar_value() is not not_set
+        return False
+
+    def _get_dump_value(self, with_defaults):
+        """
+        Returns the value to export for this item or ``not_set`` if the item is to be left out,
+        same as checking :attr:`.has_value` and :attr:`.is_default` before reading :attr:`.value`,
+        but with the environment variable consulted only once.
+        """
+        if not _has_plain_value_access(self.__class__):
+            if self.has_value and (with_defaults or not self.is_default):
+                return self.value
+            return not_set
+
+        if self.envvar:
+            value = self._get_envvar_value()
+            if value is not not_set:
+                if not with_defaults and value == self._default:
+                    return not_set
+                return value
+
+        value = self._value
+        if value is not not_set:
+            if not with_defaults and value == self._default:
+                return not_set
+            return value
+
+        default = self._default
+        if with_defaults and default is not not_set:
+            return _deepcopy(default)
+        return not_set
 
     @property
     def section(self):
@@ -321,8 +413,9 @@ class Item(BaseItem):
 
         Path value is stable only once the configuration tree is completely initialised.
         """
-        if self.section:
-            return self.section.get_path() + (self.name,)
+        section = self._section
+        if section is not None:
+            return section.get_path() + (self.name,)
         else:
             return self.name,
 
@@ -1,6 +1,5 @@
 from .changesets import _ChangesetContext
 from .meta import ConfigManagerSettings
-from .persistence import ConfigPersistenceAdapter, YamlReaderWriter, JsonReaderWriter, ConfigParserReaderWriter
 from .schema_parser import parse_config_schema
 from .sections import Section
 from .utils import _get_persistence_adapter_for
@@ -94,13 +93,22 @@ class Config(Section):
 
     is_config = True
 
+    # Attributes of Config itself are slots. Section provides the __dict__
+    # for any other (private) attributes.
+    __slots__ = (
+        '_settings', '_changeset_contexts',
+        '_configparser_adapter', '_json_adapter', '_yaml_adapter', '_click_extension',
+    )
+
     def __init__(self, schema=None, **configmanager_settings):
         if 'configmanager_settings' in configmanager_settings:
             if len(configmanager_settings) > 1:
                 raise ValueError('Dubious configmanager_settings specification: {}'.format(configmanager_settings))
             configmanager_settings = configmanager_settings['configmanager_settings']
 
-        if not isinstance(configmanager_settings, ConfigManagerSettings):
+        if isinstance(configmanager_settings, ConfigManagerSettings):
+            self._settings = configmanager_settings
+        else:
             self._settings = ConfigManagerSettings(**configmanager_settings)
 
         super(Config, self).__init__()
@@ -118,9 +126,6 @@ class Config(Section):
         if self.settings.auto_load:
             self.load()
 
-    def __repr__(self):
-        return '<{cls} {alias} at {id}>'.format(cls=self.__class__.__name__, alias=self.alias, id=id(self))
-
     def __call__(self, values=None):
         """
         Returns a changeset context which auto-resets itself on exit.
@@ -158,6 +163,7 @@ class Config(Section):
             ConfigPersistenceAdapter
         """
         if self._configparser_adapter is None:
+            from .persistence import ConfigPersistenceAdapter, ConfigParserReaderWriter
             self._configparser_adapter = ConfigPersistenceAdapter(
                 config=self,
                 reader_writer=ConfigParserReaderWriter(
@@ -175,6 +181,7 @@ class Config(Section):
             ConfigPersistenceAdapter
         """
         if self._json_adapter is None:
+            from .persistence import ConfigPersistenceAdapter, JsonReaderWriter
             self._json_adapter = ConfigPersistenceAdapter(
                 config=self,
                 reader_writer=JsonReaderWriter(),
@@ -190,6 +197,7 @@ class Config(Section):
             ConfigPersistenceAdapter
         """
         if self._yaml_adapter is None:
+            from .persistence import ConfigPersistenceAdapter, YamlReaderWriter
             self._yaml_adapter = ConfigPersistenceAdapter(
                 config=self,
                 reader_writer=YamlReaderWriter(),
@@ -218,10 +226,18 @@ class Config(Section):
 
         # Must reverse because we want the sources assigned to higher-up Config instances
         # to overrides sources assigned to lower Config instances.
+        # The whole tree is walked here once, so nested configs only load their own sources
+        # (calling their load() would walk their part of the tree and load their nested configs again).
         for section in reversed(list(self.iter_sections(recursive=True, key=None))):
             if section.is_config:
-                section.load()
+                section._load_sources()
+
+        self._load_sources()
 
+    def _load_sources(self):
+        """
+        Load configuration from the sources listed in settings of this config.
+        """
         for source in self.settings.load_sources:
             adapter = getattr(self, _get_persistence_adapter_for(source))
             if adapter.store_exists(source):
@@ -1,7 +1,7 @@
-import copy
 import os.path
 
 from .items import Item
+from .utils import _atomic_types, _deepcopy
 
 
 class ConfigManagerSettings(object):
@@ -37,26 +37,40 @@ class ConfigManagerSettings(object):
             else:
                 self._settings[k] = v
 
+        # Settings are read on hot paths (key_getter on every attribute access on a section)
+        # and every read that falls through to __getattr__ first raises an AttributeError.
+        # So settings are also kept as instance attributes. Values of immutable settings
+        # that aren't atomic are still read through __getattr__ which copies them.
+        instance_dict = self.__dict__
+        for k, v in self._settings.items():
+            if not k.startswith('_') and (not immutable or type(v) in _atomic_types):
+                instance_dict[k] = v
+
         if self.app_name:
             self.load_sources.append(self.user_app_config)
 
     def __repr__(self):
-        return '<ConfigManagerSettings {!r}>'.format(self._settings)
+        return f'<ConfigManagerSettings {self._settings!r}>'
 
-    def __str__(self):
-        return '<ConfigManagerSettings {!r}>'.format(self._settings)
+    __str__ = __repr__
 
     def __getattr__(self, item):
-        if item not in self._settings and item in self._factories:
-            self._settings[item] = self._factories[item]()
-
-        if item in self._settings:
-            if self._is_immutable:
-                return copy.deepcopy(self._settings[item])
-            else:
-                return self._settings[item]
-
-        raise AttributeError(item)
+        # Settings are read on many hot paths, so look them up only once.
+        settings = self._settings
+        try:
+            value = settings[item]
+        except KeyError:
+            factory = self._factories.get(item)
+            if factory is None:
+                raise AttributeError(item)
+            value = settings[item] = factory()
+            if not self._is_immutable:
+                self.__dict__[item] = value
+
+        if self._is_immutable:
+            return _deepcopy(value)
+        else:
+            return value
 
     def create_configparser_factory(self):
         import configparser
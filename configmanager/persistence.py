@@ -1,10 +1,90 @@
-import collections
-from io import open
+import functools
 import os.path
-
-from builtins import str
-import configparser
-import six
+import re
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ini_patterns():
+    """
+    Compiled patterns of section headers and options, built on first use
+    so that importing the package doesn't pay for them.
+    """
+    return (
+        re.compile(r'\[([^\]]+)\]\s*$'),
+        re.compile(r'([^=:#;\s\[][^=:]*?)\s*[:=]\s*(.*?)\s*$'),
+    )
+
+
+def _fast_parse_ini(text, default_section, no_section):
+    """
+    Parse the plain subset of INI -- section headers, ``key = value`` lines, comments
+    and blank lines -- straight into the dictionary that ``load_values`` expects.
+
+    Values of the default section are merged into every other section, as ``ConfigParser`` does.
+
+    Returns ``None`` if the text uses anything beyond that (interpolation, continuation
+    lines, duplicates, malformed lines), in which case the caller must fall back to ``ConfigParser``.
+    """
+    if '%' in text:
+        return None
+
+    sections = {}
+    section_values = None
+    section_re, option_re = _get_ini_patterns()
+    section_match = section_re.match
+    option_match = option_re.match
+
+    for line in text.splitlines():
+        if not line or line.isspace() or line[0] in '#;':
+            continue
+        if line[0].isspace():
+            return None
+
+        match = option_match(line)
+        if match is not None:
+            if section_values is None:
+                return None
+            option = match.group(1).lower()
+            if option in section_values:
+                return None
+            section_values[option] = match.group(2)
+            continue
+
+        match = section_match(line)
+        if match is None:
+            return None
+        section = match.group(1)
+        if section in sections:
+            return None
+        section_values = sections[section] = {}
+
+    defaults = sections.pop(default_section, None)
+    values = dict(defaults) if defaults else {}
+    for section, section_values in sections.items():
+        if defaults:
+            # Section's own options first, then those of the default section, as in ConfigParser.options()
+            for option, value in defaults.items():
+                section_values.setdefault(option, value)
+        if section == no_section:
+            values.update(section_values)
+        elif section_values:
+            values[section] = section_values
+    return values
+
+
+def _write_ini(sections, file_obj):
+    """
+    Write ``sections`` (a dictionary of dictionaries of strings) to ``file_obj``
+    formatted exactly like ``ConfigParser.write`` would format them.
+    """
+    lines = []
+    for section, section_values in sections.items():
+        lines.append(f'[{section}]\n')
+        for option, value in section_values.items():
+            value = value.replace('\n', '\n\t')
+            lines.append(f'{option} = {value}\n')
+        lines.append('\n')
+    file_obj.write(''.join(lines))
 
 
 class ConfigReaderWriter(object):
@@ -41,7 +121,7 @@ class ConfigPersistenceAdapter(object):
             as_defaults (bool): if ``True``, contents of ``source`` will be treated as schema of configuration items.
 
         """
-        if isinstance(source, six.string_types):
+        if isinstance(source, str):
             source = os.path.expanduser(source)
             with open(source, encoding='utf-8') as f:
                 self._rw.load_config_from_file(self._config, f, as_defaults=as_defaults)
@@ -74,7 +154,7 @@ class ConfigPersistenceAdapter(object):
             with_defaults (bool): if ``True``, values of items with no custom values will be included in the output
                 if they have a default value set.
         """
-        if isinstance(destination, six.string_types):
+        if isinstance(destination, str):
             with open(destination, 'w', encoding='utf-8') as f:
                 self._rw.dump_config_to_file(self._config, f, with_defaults=with_defaults)
         else:
@@ -104,35 +184,26 @@ class JsonReaderWriter(ConfigReaderWriter):
         self.json = json
 
     def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
-        # See comment in JsonReaderWriter.dump_config_to_string
+        # Serialised in one go rather than with json.dump which writes many small chunks.
         file_obj.write(self.dump_config_to_string(config, with_defaults=with_defaults), **kwargs)
 
     def dump_config_to_string(self, config, with_defaults=False, **kwargs):
-        # There is some inconsistent behaviour in Python 2's json.dump as described here:
-        # http://stackoverflow.com/a/36008538/38611
-        # and io.open which we use for file opening is very strict and fails if
-        # the string we are trying to write is not unicode in Python 2
-        # because we open files with encoding=utf-8.
-        result = self.json.dumps(
-            config.dump_values(with_defaults=with_defaults, dict_cls=collections.OrderedDict),
+        return self.json.dumps(
+            config.dump_values(with_defaults=with_defaults),
             ensure_ascii=False,
             indent=2,
             **kwargs
         )
-        if not isinstance(result, str):
-            return str(result)
-        else:
-            return result
 
     def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
         config.load_values(
-            self.json.load(file_obj, object_pairs_hook=collections.OrderedDict, **kwargs),
+            self.json.load(file_obj, **kwargs),
             as_defaults=as_defaults,
         )
 
     def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
         config.load_values(
-            self.json.loads(string, object_pairs_hook=collections.OrderedDict, **kwargs),
+            self.json.loads(string, **kwargs),
             as_defaults=as_defaults,
         )
 
@@ -147,61 +218,74 @@ class YamlReaderWriter(ConfigReaderWriter):
         except ImportError:
             raise RuntimeError('To use YAML, please install PyYAML first')
 
-        #
-        # The code to preserve order of items is taken from here:
-        # https://stackoverflow.com/a/21048064/38611
-        #
+        # Dicts preserve insertion order so there is no need to dump and load
+        # OrderedDicts. PyYAML sorts mapping keys when dumping though,
+        # so dicts are represented by their items in a dumper of our own
+        # (rather than by registering a representer globally).
 
-        _mapping_tag = yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG
+        class Dumper(yaml.Dumper):
+            pass
 
         def dict_representer(dumper, data):
             return dumper.represent_dict(data.items())
 
-        def dict_constructor(loader, node):
-            return collections.OrderedDict(loader.construct_pairs(node))
-
-        yaml.add_representer(collections.OrderedDict, dict_representer)
-        yaml.add_constructor(_mapping_tag, dict_constructor)
+        Dumper.add_representer(dict, dict_representer)
 
         self.yaml = yaml
 
+        # libyaml's loader (when PyYAML is built with it) builds the same plain dicts
+        # and lists as the pure-Python SafeLoader, only much faster.
+        self.loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
         self.default_dump_options = {
             'indent': 2,
             'default_flow_style': False,
+            'Dumper': Dumper,
         }
 
     def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
         for k, v in self.default_dump_options.items():
             kwargs.setdefault(k, v)
-        self.yaml.dump(
-            config.dump_values(with_defaults=with_defaults, dict_cls=collections.OrderedDict),
-            file_obj,
-            **kwargs
-        )
+        self.yaml.dump(config.dump_values(with_defaults=with_defaults), file_obj, **kwargs)
 
     def dump_config_to_string(self, config, with_defaults=False, **kwargs):
         for k, v in self.default_dump_options.items():
             kwargs.setdefault(k, v)
-        return self.yaml.dump(
-            config.dump_values(with_defaults=with_defaults, dict_cls=collections.OrderedDict),
-            **kwargs
-        )
+        return self.yaml.dump(config.dump_values(with_defaults=with_defaults), **kwargs)
 
     def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
-        config.load_values(self.yaml.safe_load(file_obj, **kwargs), as_defaults=as_defaults)
+        config.load_values(self.yaml.load(file_obj, Loader=self.loader, **kwargs), as_defaults=as_defaults)
 
     def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
-        config.load_values(self.yaml.safe_load(string, **kwargs), as_defaults=as_defaults)
+        config.load_values(self.yaml.load(string, Loader=self.loader, **kwargs), as_defaults=as_defaults)
 
 
 class ConfigParserReaderWriter(ConfigReaderWriter):
     no_section = 'NO_SECTION'
 
-    def __init__(self, config_parser_factory=None, **options):
+    def __init__(self, config_parser_factory=None, fast_parse=True, fast_write=True, **options):
         super(ConfigParserReaderWriter, self).__init__(**options)
+
+        # Imported here so that configs which never touch INI files don't pay for it.
+        import configparser
+
         self.config_parser_factory = config_parser_factory or configparser.ConfigParser
+        self.default_section = configparser.DEFAULTSECT
+
+        # Simple INI files are parsed without ConfigParser. Only done when the factory
+        # is the stock ConfigParser because a custom one may parse differently.
+        self.fast_parse = fast_parse and self.config_parser_factory is configparser.ConfigParser
+
+        # Likewise, simple configs are written without populating a ConfigParser first.
+        self.fast_write = fast_write and self.config_parser_factory is configparser.ConfigParser
 
     def dump_config_to_file(self, config, file_obj, with_defaults=False, **kwargs):
+        if self.fast_write:
+            sections = self._get_simple_ini_sections(config, with_defaults=with_defaults)
+            if sections is not None:
+                _write_ini(sections, file_obj)
+                return
+
         cp = self.config_parser_factory()
         self._load_config_into_config_parser(config, cp, with_defaults=with_defaults)
         cp.write(file_obj)
@@ -213,67 +297,101 @@ class ConfigParserReaderWriter(ConfigReaderWriter):
         return f.getvalue()
 
     def load_config_from_file(self, config, file_obj, as_defaults=False, **kwargs):
-        cp = self.config_parser_factory()
-        cp.read_file(file_obj)
-        self._load_config_from_config_parser(config, cp, as_defaults=as_defaults)
+        # Read the whole file at once and parse it in memory.
+        values = self._parse_string(file_obj.read(), source=getattr(file_obj, 'name', '<???>'))
+        config.load_values(values, as_defaults=as_defaults)
 
     def load_config_from_string(self, config, string, as_defaults=False, **kwargs):
-        cp = self.config_parser_factory()
-        cp.read_string(string)
-        self._load_config_from_config_parser(config, cp, as_defaults=as_defaults)
+        config.load_values(self._parse_string(string), as_defaults=as_defaults)
 
-    def _load_config_from_config_parser(self, config, cp, as_defaults=False):
+    def _parse_string(self, string, source='<string>'):
+        if self.fast_parse:
+            values = _fast_parse_ini(string, self.default_section, self.no_section)
+            if values is not None:
+                return values
 
-        # TODO Clean up the repetition here!
+        cp = self.config_parser_factory()
+        cp.read_string(string, source=source)
+        # Without a '%' anywhere in the text the stock ConfigParser's interpolation
+        # can't change any value, so values can be read raw.
+        return self._get_config_parser_values(cp, raw=self.fast_parse and '%' not in string)
 
-        # TODO Shouldn't really use create_item and create_section methods here,
-        # TODO should use load_values(..., as_defaults=True) instead!
+    def _get_config_parser_values(self, cp, raw=False):
+        """
+        Collect everything in one structural walk over the parser so that the config
+        can resolve each section and item only once in load_values.
+        """
+        defaults = cp.defaults()
+        values = dict(defaults)
+        cp_items = cp.items
+        no_section = self.no_section
 
-        for option, value in cp.defaults().items():
-            if as_defaults:
-                if option not in config:
-                    config.add_item(option, config.create_item(option, default=value))
-                else:
-                    config[option].default = value
+        for section in cp.sections():
+            if section == no_section:
+                values.update(cp_items(section, raw=raw))
             else:
-                if option not in config:
-                    continue
-                config[option].value = value
+                section_values = dict(cp_items(section, raw=raw))
+                if defaults:
+                    # items() lists options of the default section first,
+                    # keep the section's own options first as options() does.
+                    section_values = {option: section_values[option] for option in cp.options(section)}
+                if section_values:
+                    values[section] = section_values
 
-        for section in cp.sections():
-            if section == self.no_section:
-                for option in cp.options(section):
-                    value = cp.get(section, option)
-                    if as_defaults:
-                        if option not in config:
-                            config.add_item(option, config.create_item(option, default=value))
-                        else:
-                            config[option].default = value
-                    else:
-                        if option not in config:
-                            continue
-                        config[option].value = value
+        return values
+
+    def _get_simple_ini_sections(self, config, with_defaults=False):
+        """
+        Collect the INI sections of ``config`` as they would end up in a ConfigParser.
+
+        Returns ``None`` if any value would have to go through interpolation checks
+        or the default section is used, in which case the caller must go through ``ConfigParser``.
+        """
+        sections = {}
+        no_section = self.no_section
+        default_section = self.default_section
+        section = section_values = None
+
+        for item_path, item in config.iter_items(recursive=True):
+            path_len = len(item_path)
+            if path_len > 2:
+                # Let _load_config_into_config_parser raise the error
+                return None
+            if not with_defaults and item.is_default:
                 continue
 
-            for option in cp.options(section):
-                value = cp.get(section, option)
-                if as_defaults:
-                    if section not in config:
-                        config.add_section(section, config.create_section())
-                    if option not in config[section]:
-                        config[section].add_item(option, config.create_item(option, default=value))
-                    else:
-                        config[section][option].default = value
-                else:
-                    if section not in config:
-                        continue
-                    if option not in config[section]:
-                        continue
-                    config[section][option].value = value
+            value = item.str_value
+            if '%' in value:
+                return None
+
+            if path_len == 2:
+                item_section, option = item_path
+            else:
+                item_section = no_section
+                option = item_path[0]
+
+            # Items come grouped by section, so look up the section only when it changes.
+            if item_section != section:
+                if item_section == default_section:
+                    return None
+                section = item_section
+                section_values = sections.get(section)
+                if section_values is None:
+                    section_values = sections[section] = {}
+
+            # Same as ConfigParser.optionxform
+            section_values[option.lower()] = value
+
+        return sections
 
     def _load_config_into_config_parser(self, config, cp, with_defaults=False):
+        sections_seen = set()
+        no_section = self.no_section
+        cp_set = cp.set
+
         for item_path, item in config.iter_items(recursive=True):
-            if len(item_path) > 2:
+            path_len = len(item_path)
+            if path_len > 2:
                 raise RuntimeError(
                     '{cls} with more than 2 path segments cannot be loaded into ConfigParser'.format(
                         cls=item.__class__.__name__,
@@ -281,12 +399,15 @@ class ConfigParserReaderWriter(ConfigReaderWriter):
             if not with_defaults and item.is_default:
                 continue
 
-            if len(item_path) == 2:
+            if path_len == 2:
                 section, option = item_path
             else:
-                section = self.no_section
+                section = no_section
                 option = item_path[0]
 
-            if not cp.has_section(section) and section != cp.default_section:
-                cp.add_section(section)
-            cp.set(section, option, item.str_value)
+            # Items come grouped by section, so check each section only once.
+            if section not in sections_seen:
+                sections_seen.add(section)
+                if not cp.has_section(section) and section != cp.default_section:
+                    cp.add_section(section)
+            cp_set(section, option, item.str_value)
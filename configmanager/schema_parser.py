@@ -1,9 +1,8 @@
 import collections.abc
-import inspect
-
-import six
+import types
 
 from .base import BaseItem, BaseSection
+from .utils import _atomic_types
 
 
 def parse_config_schema(schema, parent_section=None, root=None):
@@ -11,7 +10,7 @@ def parse_config_schema(schema, parent_section=None, root=None):
         parent_section = root
 
         is_valid_config_root_schema = (
-            inspect.ismodule(schema)
+            isinstance(schema, types.ModuleType)
             or
             (
                 isinstance(schema, collections.abc.Sequence)
@@ -30,23 +29,27 @@ def parse_config_schema(schema, parent_section=None, root=None):
                 'got a {}'.format(type(schema)),
             )
 
+    if type(schema) in _atomic_types:
+        # Most values in a schema are plain values -- declarations of items.
+        return parent_section.create_item(default=schema)
+
     if isinstance(schema, (BaseItem, BaseSection)):
         # Do not parse existing objects of our hierarchy
         return schema
 
-    elif inspect.ismodule(schema):
+    elif isinstance(schema, types.ModuleType):
         return parse_config_schema(schema.__dict__, parent_section=parent_section, root=root)
 
-    elif isinstance(schema, collections.abc.Mapping):
+    elif type(schema) is dict or isinstance(schema, collections.abc.Mapping):
 
         if len(schema) == 0:
             # Empty dictionary means an empty item
             return parent_section.create_item(default=schema)
 
         # Create a list of tuples so we can use the standard schema parser below
-        return parse_config_schema([x for x in schema.items()], parent_section=parent_section, root=root)
+        return parse_config_schema(list(schema.items()), parent_section=parent_section, root=root)
 
-    if isinstance(schema, collections.abc.Sequence) and not isinstance(schema, six.string_types):
+    if isinstance(schema, collections.abc.Sequence) and not isinstance(schema, str):
 
         if len(schema) == 0 or not isinstance(schema[0], tuple):
             # Declaration of an item
@@ -80,8 +83,12 @@ def parse_config_schema(schema, parent_section=None, root=None):
             obj = parse_config_schema(v, parent_section=section)
             if obj.is_section:
                 section.add_section(k, obj)
-            else:
+            elif obj is v:
+                # An item declared in the schema, add a copy of it
                 section.add_item(k, obj)
+            else:
+                # A new item created from the schema
+                section._add_item(k, obj)
 
         return section
 
@@ -1,16 +1,15 @@
-import collections
 import copy
 import functools
 import keyword
+import sys
 
-import six
 from hookery import HookRegistry
 
 from .schema_parser import parse_config_schema
 from .meta import ConfigManagerSettings
 from .exceptions import NotFound
 from .utils import not_set
-from .base import BaseSection, is_config_item, is_config_section
+from .base import BaseItem, BaseSection, is_config_item, is_config_section
 
 
 _iter_emitters = {
@@ -22,6 +21,57 @@ _iter_emitters = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_str_path(path, separator):
+    """
+    Split a string path into a tuple of names, stripping the trailing underscore
+    of names that are Python keywords (``class_`` -> ``class``).
+
+    Paths are immutable strings so the result is memoised -- the same paths
+    tend to be looked up over and over again.
+    """
+    clean_path = []
+    for part in path.split(separator):
+        if part.endswith('_') and keyword.iskeyword(part[:-1]):
+            clean_path.append(_intern(part[:-1]))
+        else:
+            clean_path.append(_intern(part))
+    return tuple(clean_path)
+
+
+#: Incremented whenever an item or a section is added to any section.
+_tree_version = 0
+
+
+def _tree_changed():
+    global _tree_version
+    _tree_version += 1
+
+
+def _intern(name):
+    """
+    Intern names used as keys of section trees so that lookups with names
+    coming from parsed paths and files can match keys by identity.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    return name
+
+
+def _clone_item(item):
+    """
+    Returns a deep copy of ``item`` detached from the section it belongs to.
+
+    A plain ``copy.deepcopy(item)`` would also copy the whole configuration tree
+    that the item has been added to, only for us to discard it, so the section
+    is mapped to ``None`` in the memo. Item types are declarations shared by items
+    so they aren't copied either. Everything else, including any ``__deepcopy__``
+    or ``__slots__`` of Item subclasses, is handled by ``copy.deepcopy`` as usual.
+    """
+    item_type = item.type
+    return copy.deepcopy(item, {id(item._section): None, id(item_type): item_type})
+
+
 class _SectionHooks(HookRegistry):
     def __init__(self, section):
         super(_SectionHooks, self).__init__(section)
@@ -40,11 +90,18 @@ class Section(BaseSection):
     # Core section functionality.
     # Keep as light as possible.
 
+    # Plain sections can be numerous in a large configuration tree so their own
+    # attributes are slots. Any other (private) attributes still go to __dict__.
+    __slots__ = (
+        '_tree', '_section', '_section_alias', '_path', '_path_index', '_settings_cache', '_hooks',
+        '__item_attributes', '__weakref__', '__dict__',
+    )
+
     _default_settings = ConfigManagerSettings(immutable=True)
 
     def __init__(self, schema=None, section=None):
         #: Actual contents of the section
-        self._tree = collections.OrderedDict()
+        self._tree = {}
 
         #: Section to which this section belongs (if any at all)
         self._section = section
@@ -52,6 +109,17 @@ class Section(BaseSection):
         #: Alias of this section with which it was added to its parent section
         self._section_alias = None
 
+        #: Cached result of get_path(), reset when the section is added to another section
+        self._path = None
+
+        #: Index of string paths resolved in this section, created on first use
+        self._path_index = None
+
+        #: Proxies handed out by get_proxy(), created on first use
+
+        #: (tree version, settings) of the most recent settings lookup through parent sections
+        self._settings_cache = None
+
         # Hooks registry
         self._hooks = _SectionHooks(self)
 
@@ -59,8 +127,8 @@ class Section(BaseSection):
         # are actually used.
         self._hooks.hook_registered(self._hook_registered)
 
-        #: Dynamic item attributes registry
-        self.__item_attributes = {}
+        #: Dynamic item attributes registry, created on first use -- most sections never register any
+        self.__item_attributes = None
 
         if schema is not None:
             self.add_schema(schema)
@@ -79,41 +147,48 @@ class Section(BaseSection):
             yield name
 
     def __repr__(self):
-        return '<{cls} {alias} at {id}>'.format(cls=self.__class__.__name__, alias=self.alias, id=id(self))
+        return f'<{self.__class__.__name__} {self.alias} at {id(self)}>'
 
     def __contains__(self, key):
+        if type(key) is str and not key.endswith('_'):
+            # Plain names (the common case) are answered by the tree itself,
+            # without raising and catching NotFound for names that aren't there.
+            if key in self._tree:
+                return True
+            if self.settings.str_path_separator not in key:
+                return False
+
+        # Resolve the key without passing the resolution to key_getter
+        # which may be expensive and is irrelevant for membership testing.
         try:
-            _ = self._get_by_key(key, handle_not_found=False)
+            self._get_item_or_section(key, handle_not_found=False)
             return True
         except NotFound:
             return False
 
     def __setitem__(self, key, value):
-        if isinstance(key, six.string_types):
-            name = key
-            rest = None
+        if isinstance(key, str):
+            self._set_key(key, value)
         elif isinstance(key, (tuple, list)) and len(key) > 0:
-            name = key[0]
             if len(key) == 1:
-                rest = None
-            else:
-                rest = key[1:]
+                self._set_key(key[0], value)
+                return
+            # Resolve the parent in one go (tuple paths are indexed)
+            # instead of slicing the path and recursing at every level,
+            # and set the key on it directly rather than re-dispatching through __setitem__.
+            parent = self._get_item_or_section(tuple(key[:-1]))
+            if not parent.is_section:
+                raise TypeError(f'{key[:-1]!r} is an item, not a section')
+            parent._set_key(key[-1], value)
         else:
-            raise TypeError('Expected either a string or a tuple as key, got {!r}'.format(key))
-
-        if rest:
-            self[name][rest] = value
-            return
-
-        self._set_key(name, value)
+            raise TypeError(f'Expected either a string or a tuple as key, got {key!r}')
 
     def __getitem__(self, key):
         return self._get_by_key(key)
 
     def __getattr__(self, name):
-        if not isinstance(name, six.string_types):
-            raise TypeError('Expected a string, got a {!r}'.format(type(name)))
-
+        # Attribute names are always strings -- getattr() rejects anything else
+        # before it gets here, so there is no type to check.
         if name.startswith('_'):
             raise AttributeError(name)
 
@@ -150,27 +225,30 @@ class Section(BaseSection):
         Do not override this method.
         """
 
-        if is_config_section(value):
+        if isinstance(value, BaseSection):
             self.add_section(key, value)
             return
 
-        if key not in self._tree or self.settings.key_setter is None:
-            if is_config_item(value):
-                self.add_item(key, value)
+        # A single probe of the tree tells whether there is anything to hand to key_setter,
+        # and settings are only consulted if there is.
+        subject = self._tree.get(key)
+        if subject is not None:
+            key_setter = self.settings.key_setter
+            if key_setter is not None:
+                key_setter(subject=subject, value=value, default_key_setter=self._default_key_setter)
                 return
 
-            raise TypeError(
-                'Section sections/items can only be replaced with sections/items, '
-                'got {type}. To set value use ..[{name}].value = <new_value>'.format(
-                    type=type(value),
-                    name=key,
-                )
-            )
+        if isinstance(value, BaseItem):
+            self.add_item(key, value)
+            return
 
-        if self.settings.key_setter is None:
-            self._default_key_setter(key, value)
-        else:
-            self.settings.key_setter(subject=self._tree[key], value=value, default_key_setter=self._default_key_setter)
+        raise TypeError(
+            'Section sections/items can only be replaced with sections/items, '
+            'got {type}. To set value use ..[{name}].value = <new_value>'.format(
+                type=type(value),
+                name=key,
+            )
+        )
 
     def _get_by_key(self, key, handle_not_found=True):
         """
@@ -179,8 +257,9 @@ class Section(BaseSection):
         Do not override this method.
         """
         resolution = self._get_item_or_section(key, handle_not_found=handle_not_found)
-        if self.settings.key_getter:
-            return self.settings.key_getter(parent=self, subject=resolution)
+        key_getter = self.settings.key_getter
+        if key_getter:
+            return key_getter(parent=self, subject=resolution)
         else:
             return resolution
 
@@ -194,16 +273,24 @@ class Section(BaseSection):
         This is needed when checking key existence -- the whole
         purpose of key existence checking is to avoid errors (and error handling).
         """
-        if isinstance(key, six.string_types):
-            if self.settings.str_path_separator in key:
-                return self._get_item_or_section(key.split(self.settings.str_path_separator))
+        if isinstance(key, str):
+            # Fast path for the most common case -- a name of an item or section
+            # of this section. Names ending with an underscore may need
+            # the keyword clean-up below so they take the slow path.
+            resolution = self._tree.get(key)
+            if resolution is not None and not key.endswith('_'):
+                return resolution
+
+            separator = self.settings.str_path_separator
+            if separator in key:
+                return self._get_item_or_section_by_str_path(key, separator, handle_not_found=handle_not_found)
 
+            # Only look the name up again if the clean-up changed it.
             if key.endswith('_') and keyword.iskeyword(key[:-1]):
                 key = key[:-1]
+                resolution = self._tree.get(key)
 
-            if key in self._tree:
-                resolution = self._tree[key]
-            else:
+            if resolution is None:
                 if handle_not_found:
                     result = self.dispatch_event(self.hooks.not_found, name=key, section=self)
                     if result is not None:
@@ -213,18 +300,111 @@ class Section(BaseSection):
                 else:
                     raise NotFound(key, section=self)
 
-        elif isinstance(key, (tuple, list)) and len(key) > 0:
-            if len(key) == 1:
-                resolution = self._get_item_or_section(key[0], handle_not_found=handle_not_found)
-            else:
-                resolution = self._get_item_or_section(
-                    key[0], handle_not_found=handle_not_found
-                )._get_item_or_section(key[1:], handle_not_found=handle_not_found)
+        elif isinstance(key, tuple) and len(key) > 0:
+            return self._get_item_or_section_by_tuple_path(key, handle_not_found=handle_not_found)
+
+        elif isinstance(key, list) and len(key) > 0:
+            resolution = self._walk_path(key, handle_not_found=handle_not_found)
+
         else:
             raise TypeError('Expected either a string or a tuple as key, got {!r}'.format(key))
 
         return resolution
 
+    def _walk_path(self, path, handle_not_found=True):
+        # Walk the path in a single pass rather than recursing on path[1:]
+        # which would allocate a new tuple at every level.
+        resolution = self
+        for name in path:
+            resolution = resolution._get_item_or_section(name, handle_not_found=handle_not_found)
+        return resolution
+
+    def _get_indexed_path(self, index_key):
+        if self._path_index is not None:
+            indexed = self._path_index.get(index_key)
+            if indexed is not None and indexed[0] == _tree_version:
+                return indexed[1]
+        return None
+
+    def _index_path(self, index_key, resolution):
+        if self._path_index is None:
+            self._path_index = {}
+        self._path_index[index_key] = (_tree_version, resolution)
+
+    def _get_item_or_section_by_tuple_path(self, key, handle_not_found=True):
+        """
+        This method must NOT be called from outside the Section class.
+
+        Tuple paths (as passed to get_item and friends) are indexed in the same
+        index as string paths, under ``(None, path)``.
+        """
+        index_key = (None, key)
+        try:
+            resolution = self._get_indexed_path(index_key)
+        except TypeError:
+            # Unhashable names, let _get_item_or_section complain about them.
+            return self._walk_path(key, handle_not_found=handle_not_found)
+        if resolution is not None:
+            return resolution
+
+        try:
+            resolution = self._walk_path(key, handle_not_found=False)
+        except NotFound:
+            if not handle_not_found:
+                raise
+            # Let not_found hooks handle it, and don't index what they return.
+            return self._walk_path(key, handle_not_found=True)
+
+        self._index_path(index_key, resolution)
+        return resolution
+
+    def _get_item_or_section_by_str_path(self, key, separator, handle_not_found=True):
+        """
+        This method must NOT be called from outside the Section class.
+
+        Resolutions of string paths found in the tree are indexed by ``(separator, path)``
+        so that repeated lookups of the same path don't walk the tree.
+        The index is invalidated whenever any section tree changes.
+        """
+        index_key = (separator, key)
+        path_index = self._path_index
+        if path_index is not None:
+            # Inlined _get_indexed_path -- this is the hot path of all string path lookups.
+            indexed = path_index.get(index_key)
+            if indexed is not None and indexed[0] == _tree_version:
+                return indexed[1]
+
+        path = _parse_str_path(key, separator)
+        try:
+            resolution = self._get_item_or_section_by_clean_path(path)
+        except NotFound:
+            if not handle_not_found:
+                raise
+            # Let not_found hooks handle it, and don't index what they return.
+            # The path is known to be missing so walk it straight away rather than
+            # have it looked up in the tuple path index and walked without hooks again.
+            return self._walk_path(path, handle_not_found=True)
+
+        self._index_path(index_key, resolution)
+        return resolution
+
+    def _get_item_or_section_by_clean_path(self, path):
+        """
+        This method must NOT be called from outside the Section class.
+
+        Resolve a tuple path produced by _parse_str_path without running
+        the key validation and clean-up of _get_item_or_section for each name.
+        Falls back to _get_item_or_section (without not_found hooks) as soon as
+        a name is not in the tree.
+        """
+        resolution = self
+        for i, name in enumerate(path):
+            try:
+                resolution = resolution._tree[name]
+            except (KeyError, AttributeError):
+                return resolution._get_item_or_section(path[i:], handle_not_found=False)
+        return resolution
+
     def get_item(self, *key):
         """
         The recommended way of retrieving an item by key when extending configmanager's behaviour.
@@ -290,27 +470,45 @@ class Section(BaseSection):
         """
         Add a config item to this section.
         """
-        if not isinstance(alias, six.string_types):
+        if not isinstance(alias, str):
             raise TypeError('Item name must be a string, got a {!r}'.format(type(alias)))
-        item = copy.deepcopy(item)
-        if item.name is not_set:
-            item.name = alias
+        self._add_item(alias, _clone_item(item))
+
+    def _add_item(self, alias, item):
+        """
+        This method must NOT be called from outside the Section class.
 
-        if self.settings.str_path_separator in item.name:
+        Add ``item`` itself rather than a copy of it. Only to be used for
+        items which have just been created for this section.
+        """
+        name = item.name
+        if name is not_set:
+            name = item.name = alias
+
+        separator = self.settings.str_path_separator
+
+        if separator in name:
             raise ValueError(
                 'Item name must not contain str_path_separator which is configured for this Config -- {!r} -- '
-                'but {!r} does.'.format(self.settings.str_path_separator, item)
+                'but {!r} does.'.format(separator, item)
             )
 
-        self._tree[item.name] = item
+        # The item keeps the same (interned) name object as the tree key
+        # so paths built from item and section names hash and compare by identity.
+        interned_name = _intern(name)
+        if interned_name is not item.name:
+            item.name = interned_name
+
+        self._tree[interned_name] = item
+        _tree_changed()
 
-        if item.name != alias:
-            if self.settings.str_path_separator in alias:
+        if name != alias:
+            if separator in alias:
                 raise ValueError(
                     'Item alias must not contain str_path_separator which is configured for this Config -- {!r} --'
-                    'but {!r} used for {!r} does.'.format(self.settings.str_path_separator, alias, item)
+                    'but {!r} used for {!r} does.'.format(separator, alias, item)
                 )
-            self._tree[alias] = item
+            self._tree[_intern(alias)] = item
 
         item._section = self
 
@@ -320,53 +518,29 @@ class Section(BaseSection):
         """
         Add a sub-section to this section.
         """
-        if not isinstance(alias, six.string_types):
+        if not isinstance(alias, str):
             raise TypeError('Section name must be a string, got a {!r}'.format(type(alias)))
 
-        self._tree[alias] = section
-
         if self.settings.str_path_separator in alias:
             raise ValueError(
                 'Section alias must not contain str_path_separator which is configured for this Config -- {!r} -- '
                 'but {!r} does.'.format(self.settings.str_path_separator, alias)
             )
 
+        alias = _intern(alias)
+        self._tree[alias] = section
+        _tree_changed()
+
         section._section = self
         section._section_alias = alias
+        section._reset_path()
 
         self.dispatch_event(self.hooks.section_added_to_section, alias=alias, section=self, subject=section)
 
-    def _get_str_path_separator(self, override=None):
-        if override is None or override is not_set:
-            return self.settings.str_path_separator
-        return override
-
-    def _parse_path(self, path=None):
-        if not path:
-            return ()
-
-        if isinstance(path, six.string_types):
-            separator = self.settings.str_path_separator
-            clean_path = []
-            for part in path.split(separator):
-                if part.endswith('_') and keyword.iskeyword(part[:-1]):
-                    clean_path.append(part[:-1])
-                else:
-                    clean_path.append(part)
-            clean_path = tuple(clean_path)
-        else:
-            clean_path = path
-
-        # This is to raise NotFound in case path doesn't exist and to have it
-        # handled by not_found hook callbacks.
-        self._get_by_key(path)
-
-        return clean_path
-
-    def _get_recursive_iterator(self, recursive=False):
+    def _get_recursive_iterator(self, recursive=False, prefix=()):
         """
         Basic recursive iterator whose only purpose is to yield all items
-        and sections in order, with their full paths as keys.
+        and sections in order, with their full paths (starting with ``prefix``) as keys.
 
         Main challenge is to de-duplicate items and sections which
         have aliases.
@@ -375,42 +549,62 @@ class Section(BaseSection):
         build others that extend this one.
         """
 
-        names_yielded = set()
+        # Sub-sections are walked with an explicit stack rather than by nesting
+        # generators which would pass every object up through all its parents.
+        stack = [(prefix, iter(self._tree.items()), set())]
 
-        for obj_alias, obj in self._tree.items():
-            if obj.is_section:
-                if obj.alias in names_yielded:
-                    continue
-                names_yielded.add(obj.alias)
+        while stack:
+            prefix, entries, names_yielded = stack[-1]
 
-                yield (obj.alias,), obj
+            for obj_alias, obj in entries:
+                if obj.is_section:
+                    alias = obj.alias
+                    if alias in names_yielded:
+                        continue
+                    names_yielded.add(alias)
 
-                if not recursive:
-                    continue
+                    yield prefix + (alias,), obj
 
-                for sub_item_path, sub_item in obj._get_recursive_iterator(recursive=recursive):
-                    yield (obj_alias,) + sub_item_path, sub_item
+                    if recursive:
+                        # Continue with the contents of the sub-section, and resume
+                        # this section once they are exhausted.
+                        stack.append((prefix + (obj_alias,), iter(obj._tree.items()), set()))
+                        break
 
-            else:
-                # _tree contains duplicates so that we can have multiple aliases point
-                # to the same item. We have to de-duplicate here.
-                if obj.name in names_yielded:
-                    continue
-                names_yielded.add(obj.name)
+                else:
+                    # _tree contains duplicates so that we can have multiple aliases point
+                    # to the same item. We have to de-duplicate here.
+                    name = obj.name
+                    if name in names_yielded:
+                        continue
+                    names_yielded.add(name)
+
+                    yield prefix + (name,), obj
 
-                yield (obj.name,), obj
+            else:
+                stack.pop()
 
     def _get_path_iterator(self, path=None, recursive=False):
-        clean_path = self._parse_path(path=path)
+        if path:
+            if isinstance(path, str):
+                clean_path = _parse_str_path(path, self.settings.str_path_separator)
+            else:
+                clean_path = tuple(path)
 
-        config = self[clean_path] if clean_path else self
+            # Path is resolved once. This raises NotFound in case path doesn't exist
+            # and has it handled by not_found hook callbacks.
+            config = self._get_item_or_section(clean_path)
 
-        if clean_path:
             yield clean_path, config
 
+        else:
+            clean_path = ()
+            config = self
+
         if config.is_section:
-            for p, obj in config._get_recursive_iterator(recursive=recursive):
-                yield (clean_path + p), obj
+            # Paths are built on top of clean_path as the tree is walked
+            # instead of concatenating clean_path with each of them.
+            yield from config._get_recursive_iterator(recursive=recursive, prefix=clean_path)
 
     def iter_all(self, recursive=False, path=None, key='path'):
         """
@@ -426,16 +620,7 @@ class Section(BaseSection):
             iterator: iterator over ``(path, obj)`` pairs of all items and
             sections contained in this section.
         """
-        if isinstance(key, six.string_types) or key is None:
-            if key in _iter_emitters:
-                emitter = _iter_emitters[key]
-            else:
-                raise ValueError('Invalid key {!r}'.format(key))
-        else:
-            emitter = lambda k, v, _, f=key: (f(k, v), v)
-
-        for p, obj in self._get_path_iterator(recursive=recursive, path=path):
-            yield emitter(p, obj, self.settings.str_path_separator)
+        return self._iter(recursive=recursive, path=path, key=key)
 
     def iter_items(self, recursive=False, path=None, key='path'):
         """
@@ -447,12 +632,7 @@ class Section(BaseSection):
                 in this section (and sub-sections if ``recursive=True``).
 
         """
-        for x in self.iter_all(recursive=recursive, path=path, key=key):
-            if key is None:
-                if x.is_item:
-                    yield x
-            elif x[1].is_item:
-                yield x
+        return self._iter(recursive=recursive, path=path, key=key, is_item=True)
 
     def iter_sections(self, recursive=False, path=None, key='path'):
         """
@@ -463,12 +643,27 @@ class Section(BaseSection):
                 in this section (and sub-sections if ``recursive=True``).
 
         """
-        for x in self.iter_all(recursive=recursive, path=path, key=key):
-            if key is None:
-                if x.is_section:
-                    yield x
-            elif x[1].is_section:
-                yield x
+        return self._iter(recursive=recursive, path=path, key=key, is_item=False)
+
+    def _iter(self, recursive=False, path=None, key='path', is_item=None):
+        """
+        Implementation of iter_all, iter_items, and iter_sections.
+
+        Objects are filtered by ``is_item`` before their keys are calculated
+        so that no keys are calculated for objects which are then discarded.
+        """
+        if isinstance(key, str) or key is None:
+            if key in _iter_emitters:
+                emitter = _iter_emitters[key]
+            else:
+                raise ValueError('Invalid key {!r}'.format(key))
+        else:
+            emitter = lambda k, v, _, f=key: (f(k, v), v)
+
+        separator = self.settings.str_path_separator
+        for p, obj in self._get_path_iterator(recursive=recursive, path=path):
+            if is_item is None or obj.is_item is is_item:
+                yield emitter(p, obj, separator)
 
     def iter_paths(self, recursive=False, path=None, key='path'):
         """
@@ -518,9 +713,9 @@ class Section(BaseSection):
 
         if flat:
             for str_path, item in self.iter_items(recursive=True, key='str_path'):
-                if item.has_value:
-                    if with_defaults or not item.is_default:
-                        values[str_path] = item.value
+                value = item._get_dump_value(with_defaults)
+                if value is not not_set:
+                    values[str_path] = value
         else:
             for item_name, item in self._tree.items():
                 if is_config_section(item):
@@ -528,9 +723,9 @@ class Section(BaseSection):
                     if section_values:
                         values[item_name] = section_values
                 else:
-                    if item.has_value:
-                        if with_defaults or not item.is_default:
-                            values[item.name] = item.value
+                    value = item._get_dump_value(with_defaults)
+                    if value is not not_set:
+                        values[item.name] = value
         return values
 
     def load_values(self, dictionary, as_defaults=False, flat=False):
@@ -552,32 +747,39 @@ class Section(BaseSection):
             # Deflatten the dictionary and then pass on to the normal case.
             separator = self.settings.str_path_separator
             flat_dictionary = dictionary
-            dictionary = collections.OrderedDict()
+            dictionary = {}
             for k, v in flat_dictionary.items():
                 k_parts = k.split(separator)
                 c = dictionary
-                for i, kp in enumerate(k_parts):
-                    if i >= len(k_parts) - 1:
-                        c[kp] = v
-                    else:
-                        if kp not in c:
-                            c[kp] = collections.OrderedDict()
-                        c = c[kp]
+                for kp in k_parts[:-1]:
+                    c = c.setdefault(kp, {})
+                c[k_parts[-1]] = v
 
         for name, value in dictionary.items():
-            if name not in self:
+            try:
+                resolution = self._get_item_or_section(name, handle_not_found=False)
+            except NotFound:
                 if as_defaults:
                     if isinstance(value, dict):
-                        self[name] = self.create_section()
-                        self[name].load_values(value, as_defaults=as_defaults)
+                        section = self.create_section()
+                        if isinstance(name, str):
+                            # Name has just been looked up, no need to go through __setitem__.
+                            self.add_section(name, section)
+                        else:
+                            self[name] = section
+                        section.load_values(value, as_defaults=as_defaults)
                     else:
-                        self[name] = self.create_item(name, default=value)
+                        item = self.create_item(name, default=value)
+                        if is_config_item(item) and isinstance(name, str):
+                            # The item has just been created, no need to add a copy of it.
+                            self._add_item(name, item)
+                        else:
+                            self[name] = item
                 else:
                     # Skip unknown names if not interpreting dictionary as defaults
                     pass
                 continue
 
-            resolution = self._get_item_or_section(name, handle_not_found=False)
             if is_config_item(resolution):
                 if as_defaults:
                     resolution.default = value
@@ -627,11 +829,19 @@ class Section(BaseSection):
         For section objects which haven't been added to a manager yet,
         this points to default settings which are the same for all such free-floating sections.
         """
-        if self._section:
-            return self._section.settings
-        else:
+        section = self._section
+        if section is None:
             return self._default_settings
 
+        # Settings are read on every key lookup, and finding them means going up
+        # the tree to the closest Config. That only changes when the tree changes.
+        cached = self._settings_cache
+        if cached is not None and cached[0] == _tree_version:
+            return cached[1]
+        settings = section.settings
+        self._settings_cache = (_tree_version, settings)
+        return settings
+
     def add_schema(self, schema):
         """
         Add schema to the configuration tree.
@@ -650,20 +860,28 @@ class Section(BaseSection):
     def get_path(self):
         """
         Calculate section's path in configuration tree.
-        Use this sparingly -- path is calculated by going up the configuration tree.
+        The path is calculated by going up the configuration tree once and is then cached
+        until the section (or one of its parent sections) is added to another section.
         For a large number of sections, it is more efficient to use iterators that return paths
         as keys.
 
         Path value is stable only once the configuration tree is completely initialised.
         """
 
-        if not self.alias:
-            return ()
+        if self._path is None:
+            if not self.alias:
+                self._path = ()
+            elif self.section:
+                self._path = self.section.get_path() + (self.alias,)
+            else:
+                self._path = self.alias,
+        return self._path
 
-        if self.section:
-            return self.section.get_path() + (self.alias,)
-        else:
-            return self.alias,
+    def _reset_path(self):
+        self._path = None
+        for obj in self._tree.values():
+            if obj.is_section and obj._section is self:
+                obj._reset_path()
 
     def item_attribute(self, f=None, name=None):
         """
@@ -675,6 +893,8 @@ class Section(BaseSection):
             attr_name = name or func.__name__
             if attr_name.startswith('_'):
                 raise RuntimeError('Invalid dynamic item attribute name -- should not start with an underscore')
+            if self.__item_attributes is None:
+                self.__item_attributes = {}
             self.__item_attributes[attr_name] = func
             return func
 
@@ -687,12 +907,25 @@ class Section(BaseSection):
         """
         Method called by item when an attribute is not found.
         """
-        if name in self.__item_attributes:
-            return self.__item_attributes[name](item)
-        elif self.section:
-            return self.section.get_item_attribute(item, name)
-        else:
+        provider = self._get_item_attribute_provider(name)
+        if provider is None:
             raise AttributeError(name)
+        return provider(item)
+
+    def _get_item_attribute_provider(self, name):
+        """
+        Returns the dynamic item attribute provider registered for ``name``
+        in this section or the closest parent section, or ``None``.
+        """
+        section = self
+        while section is not None:
+            item_attributes = section.__item_attributes
+            if item_attributes is not None:
+                provider = item_attributes.get(name)
+                if provider is not None:
+                    return provider
+            section = section._section
+        return None
 
     def _hook_registered(self):
         if self.settings.hooks_enabled is None:
@@ -711,30 +944,48 @@ class Section(BaseSection):
             down below, events will still be dispatched down below because
             that's where they originate.
         """
-        if self.settings.hooks_enabled:
-            result = self.hooks.dispatch_event(event_, **kwargs)
-            if result is not None:
-                return result
-
-            # Must also dispatch the event in parent section
-            if self.section:
-                return self.section.dispatch_event(event_, **kwargs)
+        # Walk up the tree in a loop rather than recursively so that kwargs aren't
+        # repacked for every parent section.
+        # Results are only returned if hooks are enabled in all sections on the way.
+        return_result = True
+        section = self
+        settings = self.settings
+        while section is not None:
+            if settings.hooks_enabled:
+                result = section.hooks.dispatch_event(event_, **kwargs)
+                if result is not None:
+                    return result if return_result else None
+            else:
+                # Settings only apply to one section, so must still
+                # dispatch the event in parent sections.
+                return_result = False
 
-        elif self.section:
-            # Settings only apply to one section, so must still
-            # dispatch the event in parent sections recursively.
-            self.section.dispatch_event(event_, **kwargs)
+            parent = section._section
+            if parent is not None and section.is_config:
+                # Only a Config has settings of its own, a plain section shares
+                # the settings of its parent so there is no need to look them up again.
+                settings = parent.settings
+            section = parent
+        return None
 
 
 class PathProxy(object):
+    __slots__ = ('__config', '__path', '__path_target')
+
     def __init__(self, config, path):
-        self.__path_getter = functools.partial(config._get_item_or_section, path)
+        self.__config = config
+        self.__path = path
         self.__path_target = not_set
 
     def _get_real_object(self):
         if self.__path_target is not_set:
-            self.__path_target = self.__path_getter()
+            self.__path_target = self.__config._get_item_or_section(self.__path)
         return self.__path_target
 
     def __getattr__(self, name):
-        return getattr(self._get_real_object(), name)
+        # Every attribute access on a proxy ends up here, so skip the method call
+        # once the target has been resolved.
+        target = self.__path_target
+        if target is not_set:
+            target = self._get_real_object()
+        return getattr(target, name)
@@ -1,7 +1,10 @@
+import copy
 import os.path
 
 
 class _NotSet(object):
+    __slots__ = ()
+
     instance = None
 
     def __init__(self):
@@ -9,12 +12,6 @@ class _NotSet(object):
             raise RuntimeError('An instance of {} already initialised'.format(self.__class__.__name__))
         self.__class__.instance = self
 
-    def __eq__(self, other):
-        return self is other
-
-    def __nonzero__(self):
-        return False
-
     def __bool__(self):
         return False
 
@@ -24,16 +21,42 @@ class _NotSet(object):
     def __repr__(self):
         return '<NotSet>'
 
+    # Copies must be the same instance -- all checks against not_set are identity checks.
+
     def __deepcopy__(self, memodict):
         return self
 
     def __copy__(self):
         return self
 
+    def __reduce__(self):
+        # Unpickles to the module-level singleton rather than to a new instance.
+        return 'not_set'
+
 
 not_set = _NotSet()
 
 
+_atomic_types = frozenset((str, bytes, int, float, bool, complex, type(None), _NotSet))
+
+
+def _deepcopy(value):
+    """
+    ``copy.deepcopy`` that returns instances of immutable built-in types
+    as they are, and copies lists and dicts of them, without going through the copy machinery.
+    """
+    value_type = type(value)
+    if value_type in _atomic_types:
+        return value
+    if value_type is list:
+        if all(type(v) in _atomic_types for v in value):
+            return value[:]
+    elif value_type is dict:
+        if all(type(k) in _atomic_types and type(v) in _atomic_types for k, v in value.items()):
+            return value.copy()
+    return copy.deepcopy(value)
+
+
 _file_ext_to_adapter_name = {
     '.json': 'json',
     '.yaml': 'yaml',
@@ -27,8 +27,6 @@ setup(
     long_description=read('README.rst'),
     packages=['configmanager'],
     install_requires=[
-        'six',
-        'future',
         'configparser',
         'hookery == 1.4.0',
     ],
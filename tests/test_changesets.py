@@ -248,6 +248,13 @@ def test_resets_single_item_changes():
         assert config.b.value == 'BBB'
         assert config.c.value == 'CCC'
 
+        # Items are tracked again after their changes are reset
+        config.c.value = 'C'
+        config.c.value = 'CC'
+        ctx.reset(config.c)
+        assert config.c.value == 'CCC'
+        assert ctx.values == {config.b: 'BBB'}
+
     assert config.a.raw_str_value is not_set
     assert config.c.raw_str_value == 'CCC'
 
@@ -387,3 +394,34 @@ def test_calling_config_returns_changeset_context_which_resets_itself_on_exit():
 
     assert config.uploads.threads.value == 1
     assert config.uploads.db.user.value == 'root'
+
+
+def test_many_changes_are_merged_into_net_changes_per_item():
+    config = Config({'a': 0, 'b': 0, 'c': 0})
+    config.c.value = 5
+
+    with config.changeset_context() as ctx:
+        for i in range(1000):
+            config.a.value = i
+            config.b.value = -i
+        for i in range(100):
+            config.c.value = i
+        config.c.value = 5
+
+        assert ctx.values == {config.a: 999, config.b: -999}
+        assert ctx.changes[config.a].old_value is not_set
+        assert ctx.changes[config.a].new_value == 999
+        assert len(ctx) == 2
+
+        ctx.reset(config.b)
+        assert ctx.values == {config.a: 999}
+        assert config.b.value == 0
+
+        for i in range(100):
+            config.b.value = i
+        assert ctx.values == {config.a: 999, config.b: 99}
+
+        ctx.reset()
+        assert ctx.values == {}
+
+    assert config.dump_values() == {'a': 0, 'b': 0, 'c': 5}
@@ -3,7 +3,7 @@ import pytest
 import click
 from click.testing import CliRunner
 
-from configmanager import Config, PlainConfig
+from configmanager import Config, Item, PlainConfig
 
 
 def test_click_option_and_click_argument():
@@ -70,3 +70,40 @@ def test_click_with_plain_config():
     result = CliRunner().invoke(my_command, ['/tmp/uploads', '--uploads-threads', '10'])
     assert result.exit_code == 0
     assert result.output == '/tmp/uploads 10\n'
+
+
+def test_click_callbacks_fall_back_to_item_values(monkeypatch):
+    class UpperItem(Item):
+        @property
+        def value(self):
+            return self.get().upper()
+
+    config = Config({
+        'greeting': UpperItem(default='hello'),
+        'name': Item(envvar=True),
+        'tmp_dir': Item(),
+    })
+
+    seen_values = []
+
+    def remember_value(ctx, param, value):
+        seen_values.append(value)
+
+    @click.command()
+    @config.click.option('--greeting', config.greeting, callback=remember_value)
+    @config.click.option('--name', config.name)
+    @config.click.option('--tmp-dir', config.tmp_dir)
+    def my_command(greeting, name, tmp_dir):
+        print('{} {} {}'.format(greeting, name, tmp_dir))
+
+    monkeypatch.setenv('NAME', 'world')
+
+    result = CliRunner().invoke(my_command)
+    assert result.exit_code == 0
+    assert result.output == 'HELLO world None\n'
+    assert seen_values == ['HELLO']
+
+    result = CliRunner().invoke(my_command, ['--greeting', 'hi', '--name', 'you'])
+    assert result.exit_code == 0
+    assert result.output == 'hi you None\n'
+    assert seen_values == ['HELLO', 'hi']
@@ -3,6 +3,7 @@
 import pytest
 
 from configmanager import Config, Section, Item, Types, NotFound, PlainConfig
+from configmanager.meta import ConfigManagerSettings
 from configmanager.utils import not_set
 
 
@@ -459,6 +460,15 @@ def test_can_use__setitem__to_create_new_deep_paths():
     config['uploads', 'db'] = Config({'user': 'root'})
     assert config.uploads.db
 
+    config['uploads', 'db', 'password'] = Item(value='secret')
+    assert config.uploads.db.password.value == 'secret'
+
+    config[['uploads', 'db', 'host']] = Item(value='localhost')
+    assert config.uploads.db.host.value == 'localhost'
+
+    with pytest.raises(TypeError):
+        config['uploads', 'threads', 'x'] = Item()
+
 
 def test_section_knows_its_alias():
     config = Config()
@@ -624,6 +634,13 @@ def test_nested_section_settings_are_the_settings_of_the_nearest_manager_in_tree
     assert c.main.b1.b2.b3.b4.settings is not c.main.settings
     assert c.main.b1.b2.b3.b4.b5.settings is c.main.b1.b2.b3.b4.settings
 
+    # Settings follow sections that are added to other configs
+    b3 = c.main.b1.b2.b3
+    other = Config()
+    other.add_section('b3', b3)
+    assert b3.settings is other.settings
+    assert b3.b4.b5.settings is c.main.b1.b2.b3.b4.settings
+
 
 def test_get_item_and_get_section_for_rich_config():
     config = Config({
@@ -697,3 +714,130 @@ def test_get_item_and_get_section_should_handle_str_paths(simple_config, plain_c
         assert custom.get_item('main.uploads.db.user').is_item
 
     assert custom.get_item('main/uploads/db/user').is_item
+
+
+def test_item_added_from_another_config_is_a_detached_copy(simple_config):
+    simple_config.uploads.db.user.value = 'admin'
+
+    config = Config()
+    config.add_item('db_user', simple_config.uploads.db.user)
+
+    assert config.db_user is not simple_config.uploads.db.user
+    assert config.db_user.section is config
+    assert config.db_user.value == 'admin'
+    assert config.db_user.default == 'root'
+
+    config.db_user.value = 'guest'
+    assert simple_config.uploads.db.user.value == 'admin'
+    assert simple_config.uploads.db.user.section is simple_config.uploads.db
+
+
+def test_mutable_item_attributes_are_copied_when_item_is_added():
+    tags = ['a', 'b']
+    item = Item('items', default=[1, 2], tags=tags)
+
+    config = Config()
+    config.add_item('items', item)
+
+    assert config.items.tags == tags
+    assert config.items.tags is not tags
+    assert config.items.default is not item.default
+    assert config.items.type is item.type
+
+
+def test_section_with_invalid_alias_is_not_added():
+    config = Config({'a': True})
+
+    with pytest.raises(ValueError):
+        config.add_section('b.c', Section())
+
+    assert list(config) == ['a']
+
+
+def test_str_path_lookups_reflect_changes_in_tree(simple_config):
+    user = simple_config['uploads.db.user']
+    assert simple_config['uploads.db.user'] is user
+
+    simple_config.uploads.db.add_item('user', Item(default='admin'))
+    assert simple_config['uploads.db.user'] is not user
+    assert simple_config['uploads.db.user'].default == 'admin'
+
+    simple_config.uploads.add_section('db', Config({'user': 'guest'}))
+    assert simple_config['uploads.db.user'].default == 'guest'
+
+    simple_config.settings.str_path_separator = '/'
+    with pytest.raises(NotFound):
+        _ = simple_config['uploads.db.user']
+    assert simple_config['uploads/db/user'].default == 'guest'
+
+
+def test_tuple_path_lookups_reflect_changes_in_tree(simple_config):
+    user = simple_config.get_item('uploads', 'db', 'user')
+    assert simple_config.get_item('uploads', 'db', 'user') is user
+    assert simple_config['uploads', 'db', 'user'] is user
+
+    simple_config.uploads.db.add_item('user', Item(default='admin'))
+    assert simple_config.get_item('uploads', 'db', 'user') is not user
+    assert simple_config.get_item('uploads', 'db', 'user').default == 'admin'
+
+    # Tuple and string path indexes must not mix up
+    assert simple_config[('uploads.db', 'user')].default == 'admin'
+
+    with pytest.raises(NotFound):
+        simple_config.get_item('uploads', 'db', 'host')
+
+
+def test_names_of_loaded_items_and_sections_are_interned():
+    import sys
+
+    # Build the names at runtime so that they aren't interned already as literals.
+    threads, db = ''.join(['thr', 'eads']), ''.join(['d', 'b'])
+
+    config = Config()
+    config.load_values({threads: 5, db: {'user': 'root'}}, as_defaults=True)
+
+    assert config.threads.name is sys.intern('threads')
+    assert config.db.alias is sys.intern('db')
+    assert config.db.user.get_path()[0] is sys.intern('db')
+
+
+def test_config_keeps_settings_instance_it_is_given():
+    settings = ConfigManagerSettings(str_path_separator='/')
+    assert Config(configmanager_settings=settings).settings is settings
+
+
+def test_configs_accept_private_attributes():
+    config = Config({'a': 1})
+    config._custom_attribute = True
+    assert config._custom_attribute
+
+    class CustomConfig(Config):
+        pass
+
+    config = CustomConfig()
+    config._custom_attribute = True
+    assert config._custom_attribute
+
+
+def test_items_added_to_config_are_copied_with_their_own_deepcopy_and_slots():
+    copies = []
+
+    class CustomItem(Item):
+        __slots__ = ('custom',)
+
+        def __deepcopy__(self, memo):
+            copies.append(self)
+            clone = CustomItem(name=self.name, default=self.default)
+            clone.custom = self.custom
+            return clone
+
+    item = CustomItem('a', default=1)
+    item.custom = 'custom'
+
+    config = Config()
+    config.add_item('a', item)
+
+    assert copies == [item]
+    assert config.a is not item
+    assert config.a.custom == 'custom'
+    assert config.a.section is config
@@ -1,4 +1,5 @@
 import collections
+import configparser
 import pytest
 
 from configmanager import Config, Item, NotFound
@@ -283,3 +284,172 @@ def test_writes_to_and_reads_from_default_section_transparently(tmpdir):
     config2.configparser.load(config_ini, as_defaults=True)
 
     assert config1.dump_values() == config2.dump_values() == {'greeting': 'Hello', 'name': 'World'}
+
+
+def test_configparser_loads_values_into_plain_config(plain_config):
+    plain_config.configparser.loads('[uploads]\nthreads = 5\nenabled = yes\n')
+
+    assert plain_config.uploads.threads == 5
+    assert plain_config.uploads.enabled is True
+
+
+def test_successive_loads_do_not_see_values_of_previous_loads():
+    config = Config()
+    config.configparser.loads('[DEFAULT]\nthreads = 5\n[uploads]\nenabled = yes\n', as_defaults=True)
+    assert config.dump_values() == {'threads': '5', 'uploads': {'threads': '5', 'enabled': 'yes'}}
+
+    other = Config()
+    other.configparser.loads('[downloads]\nenabled = no\n', as_defaults=True)
+    config.configparser.loads('[downloads]\nenabled = no\n', as_defaults=True)
+    assert 'threads' not in config.downloads
+    assert config.downloads.dump_values() == other.downloads.dump_values() == {'enabled': 'no'}
+
+    assert config.configparser.dumps(with_defaults=True) == (
+        '[NO_SECTION]\nthreads = 5\n\n'
+        '[uploads]\nenabled = yes\nthreads = 5\n\n'
+        '[downloads]\nenabled = no\n\n'
+    )
+
+
+@pytest.mark.parametrize('ini', [
+    '',
+    '[uploads]\nthreads = 5\nenabled: yes\n',
+    '# comment\n; another\n\n[Uploads]\nThreads=5\n  \n[downloads]\n[db]\nurl = a=b:c  \n',
+    '[NO_SECTION]\ngreeting = Hello\n[db]\nuser = root\n',
+    '[DEFAULT]\nthreads = 5\n[uploads]\nenabled = yes\n',
+    '[uploads]\nthreads = 1\n[downloads]\n[NO_SECTION]\nname = x\n[DEFAULT]\nthreads = 5\nenabled = no\n',
+    '[DEFAULT]\n[uploads]\nthreads = 1\n',
+    '[DEFAULT]\nthreads = 5\n[DEFAULT]\nenabled = no\n',
+    '[uploads]\npath = %(home)s/uploads\nhome = /home\n',
+    '[uploads]\ndescription = first line\n  second line\n',
+])
+def test_fast_parse_produces_same_values_as_configparser(ini):
+    fast = Config()
+    fast.configparser.loads(ini, as_defaults=True)
+
+    slow = Config()
+    slow.configparser._rw.fast_parse = False
+    slow.configparser._rw.fast_write = False
+    slow.configparser.loads(ini, as_defaults=True)
+
+    assert fast.dump_values() == slow.dump_values()
+    assert list(fast.iter_paths(recursive=True)) == list(slow.iter_paths(recursive=True))
+    assert fast.configparser.dumps(with_defaults=True) == slow.configparser.dumps(with_defaults=True)
+
+
+@pytest.mark.parametrize('values', [
+    {'greeting': 'Hello', 'uploads': {'Threads': 5, 'enabled': True}, 'db': {'user': 'root'}},
+    {'uploads': {'description': 'first line\nsecond line', 'empty': ''}},
+    {'uploads': {'path': '%(home)s/uploads', 'home': '/home'}},
+    {'DEFAULT': {'threads': 5}, 'uploads': {'enabled': 'yes'}},
+])
+def test_fast_write_produces_same_output_as_configparser(values):
+    fast = Config(values)
+
+    slow = Config(values)
+    slow.configparser._rw.fast_write = False
+
+    assert fast.configparser.dumps(with_defaults=True) == slow.configparser.dumps(with_defaults=True)
+    assert fast.configparser.dumps() == slow.configparser.dumps()
+
+
+def test_fast_parse_falls_back_to_configparser_errors():
+    config = Config()
+    with pytest.raises(configparser.Error):
+        config.configparser.loads('threads = 5\n')
+    with pytest.raises(configparser.Error):
+        config.configparser.loads('[uploads]\nthreads = 5\nthreads = 6\n')
+
+
+def test_values_read_by_configparser_are_interpolated_only_when_needed():
+    config = Config()
+    config.configparser.loads(
+        '[DEFAULT]\nhome = /home\n[uploads]\ndescription = first\n  second\n',
+        as_defaults=True,
+    )
+    assert config.dump_values() == {
+        'home': '/home',
+        'uploads': {'home': '/home', 'description': 'first\nsecond'},
+    }
+
+    config = Config()
+    config.configparser.loads(
+        '[DEFAULT]\nhome = /home\n[uploads]\npath = %(home)s/uploads\n',
+        as_defaults=True,
+    )
+    assert config.uploads.path.value == '/home/uploads'
+
+
+def test_reloading_same_file_reflects_changes_in_file(tmpdir):
+    config_ini = tmpdir.join('config.ini')
+    config_ini.write('[uploads]\nthreads = 5\n')
+
+    config = Config({'uploads': {'threads': 1}})
+    config.configparser.load(config_ini.strpath)
+    assert config.uploads.threads.value == 5
+
+    config.configparser.load(config_ini.strpath)
+    assert config.uploads.threads.value == 5
+
+    config_ini.write('[uploads]\nthreads = 6\n')
+    config.configparser.load(config_ini.strpath)
+    assert config.uploads.threads.value == 6
+
+    other = Config()
+    other.configparser.loads('[uploads]\nthreads = 6\n', as_defaults=True)
+    other.configparser.loads('[uploads]\nthreads = 6\n', as_defaults=True)
+    assert other.dump_values() == {'uploads': {'threads': '6'}}
+
+
+class _CountingReader(object):
+    def __init__(self, text):
+        self.text = text
+        self.reads = 0
+
+    def read(self, *args):
+        self.reads += 1
+        return self.text
+
+    def readline(self, *args):
+        raise AssertionError('File should be read in one go, not line by line')
+
+    def __iter__(self):
+        raise AssertionError('File should be read in one go, not line by line')
+
+
+@pytest.mark.parametrize('ini', [
+    '[uploads]\nthreads = 5\n',
+    '[uploads]\ndescription = first line\n  second line\n',
+])
+def test_file_is_read_in_one_go(ini):
+    file_obj = _CountingReader(ini)
+    config = Config()
+    config.configparser.load(file_obj, as_defaults=True)
+    assert file_obj.reads == 1
+    assert config.uploads.is_section
+
+
+def test_config_parser_factory_defaults_are_available_in_every_load():
+    config = Config(configmanager_settings={
+        'configparser_factory': lambda: configparser.ConfigParser(defaults={'home': '/home'}),
+    })
+
+    config.configparser.loads('[uploads]\np1 = %(home)s/x\n', as_defaults=True)
+    config.configparser.loads('[uploads]\np2 = %(home)s/y\n', as_defaults=True)
+
+    assert config.uploads.p1.value == '/home/x'
+    assert config.uploads.p2.value == '/home/y'
+
+
+@pytest.mark.parametrize('fast_parse', [True, False])
+def test_options_of_default_section_come_after_options_of_section(fast_parse):
+    config = Config()
+    config.configparser._rw.fast_parse = fast_parse
+    config.configparser.loads('[DEFAULT]\nthreads = 5\n[uploads]\nenabled = yes\n', as_defaults=True)
+
+    assert config.configparser.dumps(with_defaults=True) == (
+        '[NO_SECTION]\nthreads = 5\n\n'
+        '[uploads]\nenabled = yes\nthreads = 5\n\n'
+    )
+    assert list(config.dump_values()) == ['threads', 'uploads']
+    assert list(config.dump_values()['uploads']) == ['enabled', 'threads']
@@ -68,3 +68,39 @@ def test_dynamic_override_of_envvar_name(monkeypatch):
 
     monkeypatch.setenv('OTHER_UPLOADS_THREADS', '42')
     assert config.uploads.threads.value == 42
+
+
+def test_auto_envvar_name_follows_item_path(monkeypatch):
+    config = Section({
+        'uploads': {
+            'threads': 1
+        }
+    })
+    config.uploads.threads.envvar = True
+
+    monkeypatch.setenv('UPLOADS_THREADS', '23')
+    monkeypatch.setenv('OTHER_UPLOADS_THREADS', '42')
+    assert config.uploads.threads.value == 23
+
+    other = Section()
+    other.add_section('other_uploads', config.uploads)
+    assert other.other_uploads.threads.value == 42
+
+
+def test_dump_values_exports_envvar_values(monkeypatch):
+    config = Section({
+        'uploads': {
+            'threads': 1,
+            'db': {'user': 'root'},
+        }
+    })
+    config.uploads.threads.envvar = True
+    config.uploads.db.user.envvar = 'DB_USER'
+
+    assert config.dump_values(with_defaults=False) == {}
+
+    monkeypatch.setenv('UPLOADS_THREADS', '1')
+    monkeypatch.setenv('DB_USER', 'admin')
+    assert config.dump_values(with_defaults=False) == {'uploads': {'db': {'user': 'admin'}}}
+    assert config.dump_values(with_defaults=False, flat=True) == {'uploads.db.user': 'admin'}
+    assert config.dump_values() == {'uploads': {'threads': 1, 'db': {'user': 'admin'}}}
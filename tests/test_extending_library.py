@@ -140,3 +140,45 @@ def test_dynamic_item_attribute_with_custom_name():
 
     with pytest.raises(AttributeError):
         _ = config.age.x
+
+
+def test_item_attributes_passed_as_kwargs_respect_overrides_in_subclasses():
+    class UpperCaseAttribute(ItemAttribute):
+        def __set__(self, instance, value):
+            super(UpperCaseAttribute, self).__set__(instance, value.upper())
+
+    class CustomItem(Item):
+        help = ItemAttribute(name='help', default='No help available!')
+        label = UpperCaseAttribute(name='label')
+
+        @property
+        def envvar(self):
+            return 'CUSTOM_ENVVAR'
+
+    item = CustomItem(help='Some help', label='threads', **{'@required': True})
+    assert item.help == 'Some help'
+    assert item.label == 'THREADS'
+    assert item.required is True
+    assert item.envvar == 'CUSTOM_ENVVAR'
+
+    assert CustomItem().help == 'No help available!'
+
+
+def test_item_attribute_declared_with_and_without_dynamic_override():
+    class CustomItem(Item):
+        help = ItemAttribute(name='help', default='No help available!')
+        label = ItemAttribute(name='label', allow_dynamic_override=True)
+
+    assert isinstance(CustomItem.__dict__['help'], ItemAttribute)
+    assert isinstance(CustomItem.__dict__['label'], ItemAttribute)
+    assert CustomItem.help == 'No help available!'
+
+    config = Config({'threads': CustomItem(default=5, label='Threads')})
+    assert config.threads.help == 'No help available!'
+    assert config.threads.label == 'Threads'
+
+    @config.item_attribute
+    def label(item):
+        return item.name.upper()
+
+    assert config.threads.label == 'THREADS'
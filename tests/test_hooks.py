@@ -93,6 +93,22 @@ def test_not_found_hook():
     assert len(calls) == 7
 
 
+def test_not_found_hook_handles_missing_str_and_tuple_paths(simple_config):
+    calls = []
+
+    @simple_config.hooks.not_found
+    def not_found(section, name):
+        calls.append((section.alias, name))
+        item = section.create_item(name=name, default=name.upper())
+        section.add_item(item.name, item)
+        return item
+
+    assert simple_config['uploads.db.host'].value == 'HOST'
+    assert simple_config['uploads', 'db', 'port'].value == 'PORT'
+    assert simple_config['uploads.db.host'].value == 'HOST'
+    assert calls == [('db', 'host'), ('db', 'port')]
+
+
 def test_item_added_to_section_hook():
     calls = []
 
@@ -422,6 +438,8 @@ def test_not_found_hook_not_handled_if_contains_raises_not_found(simple_config):
     assert len(calls) == 0
 
     assert 'downloads' not in simple_config
+    assert 'uploads.downloads' not in simple_config
+    assert ('uploads', 'downloads') not in simple_config
 
     assert len(calls) == 0
 
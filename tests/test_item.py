@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
+
 import pytest
-import six
-from builtins import str
 
 from configmanager.utils import not_set
-from configmanager import Item, RequiredValueMissing, Types
+from configmanager import Config, Item, RequiredValueMissing, Types
 
 
 def test_required_value_missing_raised_when_required_value_missing():
@@ -108,6 +109,9 @@ def test_repr_makes_clear_name_and_value():
     c.value = 'bye!'
     assert repr(c) == '<Item a \'bye!\'>'
 
+    c.reset()
+    assert repr(c) == '<Item a \'hello\'>'
+
 
 def test_str_and_repr_of_not_set_value_should_not_fail():
     c = Item('a')
@@ -117,10 +121,10 @@ def test_str_and_repr_of_not_set_value_should_not_fail():
 
 def test_bool_str_is_a_str():
     c = Item('a', type=bool)
-    assert isinstance(c.str_value, six.string_types)
+    assert isinstance(c.str_value, str)
 
     c.value = True
-    assert isinstance(c.str_value, six.string_types)
+    assert isinstance(c.str_value, str)
 
 
 def test_bool_config_preserves_raw_str_value_used_to_set_it():
@@ -404,6 +408,15 @@ def test_item_attribute_names_should_start_with_a_letter():
         Item(**{'_comment': 'This must fail'})
 
 
+def test_item_attribute_values_are_stored_under_interned_names():
+    name_attribute = vars(Item)['name']
+
+    for item in (Item(name='a'), Item()):
+        item.name = 'b'
+        stored_names = [k for k in item.__dict__ if k == '_name']
+        assert stored_names[0] is name_attribute.attr_name
+
+
 def test_non_special_default_values_are_converted_to_items_declared_type():
     i = Item(type=int, default='3')
     assert i.default == 3
@@ -429,3 +442,44 @@ def test_item_type_can_be_specified_as_a_string():
 def test_path_of_unattached_item_is_a_tuple_of_its_name():
     name = Item(name='x')
     assert name.get_path() == ('x',)
+
+
+def test_not_set_is_a_falsey_hashable_singleton():
+    assert not not_set
+    assert not_set == not_set
+    assert not_set != None  # noqa
+    assert {not_set: 1}[not_set] == 1
+    assert copy.copy(not_set) is not_set
+    assert copy.deepcopy({'x': [not_set]})['x'][0] is not_set
+    assert pickle.loads(pickle.dumps(not_set)) is not_set
+
+
+def test_values_of_mutable_defaults_are_copies():
+    tags = Item(default=['a', 'b'])
+    tags.value.append('c')
+    assert tags.value == ['a', 'b']
+
+    db = Item(default={'user': 'root', 'hosts': ['a']})
+    db.value['user'] = 'admin'
+    db.value['hosts'].append('b')
+    assert db.value == {'user': 'root', 'hosts': ['a']}
+
+
+def test_item_subclass_can_override_default():
+    class DefaultFromElsewhere(Item):
+        @property
+        def default(self):
+            return 'elsewhere'
+
+    item = DefaultFromElsewhere('a')
+    assert item.value == 'elsewhere'
+    assert item.str_value == 'elsewhere'
+    assert item.has_value
+    assert item.is_default
+
+    item.value = 'custom'
+    assert not item.is_default
+
+    config = Config({'a': DefaultFromElsewhere()})
+    assert config.dump_values(with_defaults=True) == {'a': 'elsewhere'}
+    assert config.dump_values(with_defaults=False) == {}
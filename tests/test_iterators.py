@@ -267,3 +267,15 @@ def test_iter_sections_with_key_none(c4):
     sections = list(c4.iter_sections(recursive=True, key=None))
     assert len(sections) == 3
     assert sections[0].is_section
+
+
+def test_iterators_accept_path_lists_and_item_paths(plain_config):
+    assert list(plain_config.iter_paths(recursive=True, path=['uploads', 'db'])) == [
+        ('uploads', 'db'),
+        ('uploads', 'db', 'user'),
+        ('uploads', 'db', 'password'),
+    ]
+
+    assert list(plain_config.iter_items(path='uploads.db.user')) == [
+        (('uploads', 'db', 'user'), plain_config.get_item('uploads', 'db', 'user')),
+    ]
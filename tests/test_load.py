@@ -67,3 +67,26 @@ def test_load_sources_setting(config, tmpdir):
     assert wrapper.main.uploads.db.user.value == 'admin'
     assert wrapper.main.uploads.db.password.value == 'SECRET'
     assert wrapper.main.greeting.value == 'Hey!'
+
+
+def test_load_loads_sources_of_each_nested_config_once(config, tmpdir):
+    json1 = tmpdir.join('config1.json').strpath
+    with open(json1, 'w') as f:
+        json.dump({'user': 'Administrator'}, f)
+
+    config.uploads.db.settings.load_sources.append(json1)
+
+    wrapper = Config({
+        'main': config,
+    })
+
+    changes = []
+
+    @config.uploads.db.hooks.item_value_changed
+    def item_value_changed(item, new_value):
+        changes.append((item.name, new_value))
+
+    wrapper.load()
+
+    assert changes == [('user', 'Administrator')]
+    assert wrapper.main.uploads.db.user.value == 'Administrator'
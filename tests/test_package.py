@@ -0,0 +1,26 @@
+import pytest
+
+import configmanager
+
+
+def test_public_names_are_importable_from_package():
+    for name in configmanager.all:
+        assert name in dir(configmanager)
+        assert getattr(configmanager, name) is not None
+
+    from configmanager.managers import Config
+    assert configmanager.Config is Config
+
+
+def test_unknown_package_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        configmanager.DoesNotExist
+
+
+def test_importing_config_does_not_import_persistence():
+    import subprocess
+    import sys
+
+    code = 'import sys; from configmanager import Config; print("configmanager.persistence" in sys.modules)'
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.strip() == b'False'
@@ -1,5 +1,4 @@
 import pytest
-import six
 
 from configmanager import NotFound, Item, PlainConfig
 
@@ -35,7 +34,7 @@ def test_items_are_values(schema):
     assert config['uploads', 'enabled'] is True
 
     assert config.uploads.db.is_section
-    assert isinstance(config.uploads.db.user, six.string_types)
+    assert isinstance(config.uploads.db.user, str)
     assert config.uploads.db.user == 'root'
 
     with pytest.raises(AttributeError):
@@ -61,6 +60,10 @@ def test_values_can_be_changed(schema):
     config.uploads.threads = '5'
     config.uploads.tmp_dir = '/tmp'
     config.uploads.db.user = 'admin'
+    config['uploads', 'db', 'password'] = 'secret2'
+
+    with pytest.raises(TypeError):
+        config['uploads', 'threads', 'x'] = 1
 
     assert config.uploads.enabled is False
     assert config.uploads.threads == 5
@@ -74,7 +77,7 @@ def test_values_can_be_changed(schema):
             'tmp_dir': '/tmp',
             'db': {
                 'user': 'admin',
-                'password': 'secret',
+                'password': 'secret2',
             }
         }
     }
@@ -1,3 +1,4 @@
+from configmanager import Item
 from configmanager.sections import PathProxy
 
 
@@ -42,3 +43,21 @@ def test_get_proxy_handles_both_sections_and_items(simple_config):
 
     assert downloads_enabled.is_item
     assert downloads_enabled.value is True
+
+
+def test_get_proxy_resolves_each_proxy_separately(simple_config):
+    enabled = simple_config.get_proxy('uploads.enabled')
+    assert enabled.value is False
+
+    simple_config.uploads.add_schema({'enabled': True})
+    assert simple_config.get_proxy('uploads.enabled').value is True
+    assert simple_config.get_proxy(['uploads', 'enabled']).value is True
+
+    values = iter([1, 2])
+
+    @simple_config.hooks.not_found
+    def provide_detached_item(name=None, section=None, **kwargs):
+        return Item(name=name, value=next(values))
+
+    assert simple_config.get_proxy('threads').value == 1
+    assert simple_config.get_proxy('threads').value == 2
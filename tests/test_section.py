@@ -96,6 +96,7 @@ def test_items_and_sections_with_python_keywords_as_names_can_be_accessed_with_s
     assert config['for', 'if', 'assert'].is_item
     assert config['for_', 'if_', 'assert_'].is_item
     assert config.for_.if_.assert_.is_item
+    assert config['for_.if_.assert_'] is config['for', 'if', 'assert']
 
     assert config.for_.import_.value == 'import'
 
@@ -131,3 +132,47 @@ def test_section_and_item_get_path():
     assert config.enabled.get_path() == ('enabled',)
     assert config.for_.if_.get_path() == ('for', 'if')
     assert config.for_.if_.assert_.get_path() == ('for', 'if', 'assert')
+
+
+def test_sections_accept_private_attributes():
+    section = Section({'enabled': True})
+    section._note = 1
+    assert section._note == 1
+
+    class CustomSection(Section):
+        pass
+
+    section = CustomSection()
+    section._custom_attribute = True
+    assert section._custom_attribute
+
+
+def test_section_path_is_updated_when_section_is_added_to_another_section():
+    db = Section({'user': 'root'})
+    assert db.get_path() == ()
+
+    uploads = Section()
+    uploads.add_section('db', db)
+    assert db.get_path() == ('db',)
+    assert db.user.get_path() == ('db', 'user')
+
+    config = Section()
+    config.add_section('uploads', uploads)
+    assert uploads.get_path() == ('uploads',)
+    assert db.get_path() == ('uploads', 'db')
+    assert db.user.get_path() == ('uploads', 'db', 'user')
+
+
+def test_membership_of_names_and_paths():
+    config = Section({'for': {'enabled': True}, 'uploads': {'threads': 1}})
+
+    assert 'uploads' in config
+    assert 'for' in config
+    assert 'for_' in config
+    assert 'uploads.threads' in config
+    assert ('uploads', 'threads') in config
+
+    assert 'downloads' not in config
+    assert 'if_' not in config
+    assert 'uploads.enabled' not in config
+    assert ('uploads', 'enabled') not in config
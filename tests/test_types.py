@@ -1,5 +1,7 @@
 import collections
 
+import pytest
+
 from configmanager import Item, Types
 from configmanager.item_types import _ItemType
 
@@ -57,6 +59,49 @@ def test_bool_type():
     assert Types.guess('False') == Types.str
 
 
+def test_bool_type_handles_mixed_case_strings():
+    assert Types.bool.deserialize('On') is True
+    assert Types.bool.deserialize('TRUE') is True
+    assert Types.bool.deserialize('Off') is False
+    assert Types.bool.deserialize('whatever') is False
+
+    assert Types.bool.accepts('Yes')
+    assert Types.bool.accepts('OFF')
+    assert not Types.bool.accepts('whatever')
+
+
+def test_bool_type_accepts_booleans_and_numbers_equal_to_0_or_1():
+    assert Types.bool.accepts(True)
+    assert Types.bool.accepts(0)
+    assert Types.bool.accepts(1)
+    assert Types.bool.accepts(0.0)
+    assert Types.bool.accepts(1.0)
+    assert not Types.bool.accepts(2)
+    assert not Types.bool.accepts(None)
+
+
+def test_repeated_strings_deserialize_to_same_values():
+    for _ in range(2):
+        assert Types.int.deserialize('5') == 5
+        assert Types.float.deserialize('5') == 5.0
+        assert type(Types.float.deserialize('5')) is float
+
+        with pytest.raises(ValueError):
+            Types.int.deserialize('five')
+
+
+def test_translate():
+    assert Types.translate(int) is Types.int
+    assert Types.translate('boolean') is Types.bool
+    assert Types.translate(Types.float) is Types.float
+
+    custom_type = lambda x: x
+    assert Types.translate(custom_type) is custom_type
+
+    with pytest.raises(ValueError):
+        Types.translate('no-such-type')
+
+
 def test_float_type():
     rate = Item(type=Types.float, default='0.23')
     assert rate.default == 0.23
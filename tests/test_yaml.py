@@ -1,5 +1,4 @@
 import pytest
-import six
 
 from configmanager import Config, PlainConfig
 
@@ -70,15 +69,13 @@ def test_config_written_to_and_read_from_yaml_string():
 
     config_str2 = config.yaml.dumps(with_defaults=True)
 
-    # TODO Fix this in Python 2
-    if six.PY3:
-        assert config_str2 == (
-            'uploads:\n'
-            '  enabled: true\n'
-            '  threads: 5\n'
-            '  db:\n'
-            '    user: root\n'
-        )
+    assert config_str2 == (
+        'uploads:\n'
+        '  enabled: true\n'
+        '  threads: 5\n'
+        '  db:\n'
+        '    user: root\n'
+    )
 
     config2 = Config()
     config2.yaml.loads(config_str2, as_defaults=True)
@@ -86,3 +83,44 @@ def test_config_written_to_and_read_from_yaml_string():
         'uploads', 'uploads.enabled', 'uploads.threads', 'uploads.db', 'uploads.db.user'
     ]
     assert config2.dump_values() == config.dump_values()
+
+
+def test_yaml_dump_preserves_order_without_changing_global_yaml_behaviour():
+    import yaml
+
+    config = Config({'uploads': {'threads': 5, 'enabled': True}, 'db': {'user': 'root'}})
+    assert config.yaml.dumps(with_defaults=True) == (
+        'uploads:\n'
+        '  threads: 5\n'
+        '  enabled: true\n'
+        'db:\n'
+        '  user: root\n'
+    )
+
+    assert yaml.dump({'b': 1, 'a': 2}, default_flow_style=False) == 'a: 2\nb: 1\n'
+
+
+def test_yaml_loaded_with_libyaml_loader_same_as_with_pure_python_loader():
+    import yaml
+
+    config_str = (
+        'greeting: Hello\n'
+        'uploads:\n'
+        '  enabled: yes\n'
+        '  threads: 5\n'
+        '  ratio: 0.5\n'
+        '  tags: [a, b]\n'
+        '  db:\n'
+        '    user: root\n'
+        '    password: ~\n'
+    )
+
+    fast = Config()
+    fast.yaml.loads(config_str, as_defaults=True)
+
+    slow = Config()
+    slow.yaml._rw.loader = yaml.SafeLoader
+    slow.yaml.loads(config_str, as_defaults=True)
+
+    assert fast.dump_values() == slow.dump_values()
+    assert list(fast.iter_paths(recursive=True)) == list(slow.iter_paths(recursive=True))